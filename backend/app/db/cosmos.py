@@ -1,150 +1,380 @@
+import asyncio
+import logging
 import os
-import re
-import uuid
-from azure.cosmos import CosmosClient, PartitionKey, exceptions
+import threading
+import time
+from azure.cosmos import PartitionKey, exceptions
+from azure.cosmos.aio import CosmosClient
 from azure.core.credentials import AzureKeyCredential
 from typing import Optional, List, Dict, Any
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from secrets import token_hex
+
+logger = logging.getLogger(__name__)
+
+_parsed_connection_strings: Dict[str, tuple] = {}
 
 def parse_cosmos_connection_string(connection_string: str) -> tuple[str, str]:
-    """Parse Cosmos DB connection string to extract endpoint and key."""
+    """Parse Cosmos DB connection string to extract endpoint and key.
+
+    The format is plain semicolon-separated key=value pairs, so a split-based
+    parse (no regex engine) is enough; results are memoized since the service
+    can be rebuilt on failure paths.
+    """
     connection_string = connection_string.strip().strip('"').strip("'")
-    
-    endpoint = None
-    key = None
-    
-    endpoint_match = re.search(r'AccountEndpoint=([^;]+)', connection_string, re.IGNORECASE)
-    if endpoint_match:
-        endpoint = endpoint_match.group(1).strip()
-    
-    key_match = re.search(r'AccountKey=([^;]+)', connection_string, re.IGNORECASE)
-    if key_match:
-        key = key_match.group(1).strip()
-    
-    return endpoint, key
+
+    cached = _parsed_connection_strings.get(connection_string)
+    if cached:
+        return cached
+
+    parts = {}
+    for segment in connection_string.split(';'):
+        if '=' in segment:
+            k, _, v = segment.partition('=')
+            parts[k.strip().lower()] = v.strip()
+
+    result = (parts.get('accountendpoint'), parts.get('accountkey'))
+    _parsed_connection_strings[connection_string] = result
+    return result
+
+# Dashboard stats don't need to be real-time; cache computed results briefly
+STATS_CACHE_TTL_SECONDS = 30
+
+# Org/user docs change rarely but are looked up on every authenticated
+# request; a short in-process TTL keeps the auth hot path off Cosmos
+AUTH_CACHE_TTL_SECONDS = 60
+
+# UI flows often GET a claim right after creating or polling it; a few
+# seconds of reuse absorbs those bursts without serving stale decisions.
+# Entries are full claim documents, so the cache is cleared when it grows
+# past the cap rather than holding every claim ever fetched
+CLAIM_CACHE_TTL_SECONDS = 5
+CLAIM_CACHE_MAX_ENTRIES = 1000
+
+# Every field the claims list/dashboard views render. List queries project to
+# these instead of SELECT * so full accident descriptions, signals, rule
+# triggers and audit baggage never cross the wire for table rows.
+CLAIM_LIST_PROJECTION = (
+    "c.id, c.claim_id, c.claimant_name, c.policy_id, c.claim_amount_gbp, "
+    "c.accident_date, c.accident_type, c.vehicle_registration, c.status, "
+    "c.fraud_score, c.risk_band, c.created_at"
+)
+
+def _utc_now() -> datetime:
+    """Current UTC time, naive, matching the format already stored in Cosmos.
+
+    datetime.utcnow() is deprecated; this keeps identical ISO strings (no
+    +00:00 suffix) so lexicographic timestamp comparisons stay valid.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
 
 class CosmosDBService:
     """
     Multi-tenant Cosmos DB Service
     All queries now filter by org_id for data isolation
+
+    Uses the async Cosmos SDK so queries don't block the FastAPI event loop;
+    the underlying aiohttp session keeps a pooled set of connections alive
+    across requests.
     """
-    
+
     def __init__(self):
+        # Per-org cache of get_stats results: org_id -> (expiry, stats dict)
+        self._stats_cache: Dict[str, tuple] = {}
+        # Auth-path TTL caches: key -> (expiry, doc). Writes invalidate keys.
+        self._org_cache: Dict[str, tuple] = {}
+        self._aad_user_cache: Dict[str, tuple] = {}
+        # Read-through claim cache: claim_id -> (expiry, claim doc)
+        self._claim_cache: Dict[str, tuple] = {}
+        # tenant -> org_id mapping is effectively immutable, so no TTL
+        self._tenant_org_ids: Dict[str, str] = {}
         connection_string = os.environ.get("COSMOS_CONNECTION_STRING")
         if not connection_string:
             raise ValueError("COSMOS_CONNECTION_STRING environment variable is required")
-        
+
         connection_string = connection_string.strip().strip('"').strip("'")
-        
+
         try:
             endpoint, key = parse_cosmos_connection_string(connection_string)
-            
+
+            # Bounded retry/backoff so throttled (429) requests recover without
+            # unbounded waits or silent RU spikes under load
+            client_kwargs = {"retry_total": 9, "retry_backoff_max": 30}
+
+            # Widen the aiohttp connection pool beyond its small default so
+            # concurrent requests aren't queued behind a handful of sockets.
+            # Built lazily-safe: falls back to the SDK default transport if no
+            # event loop is running yet.
+            transport = self._build_transport()
+            if transport is not None:
+                client_kwargs["transport"] = transport
             if endpoint and key:
-                self.client = CosmosClient(endpoint, credential=key)
+                self.client = CosmosClient(endpoint, credential=key, **client_kwargs)
             else:
-                self.client = CosmosClient.from_connection_string(connection_string)
-            
+                self.client = CosmosClient.from_connection_string(connection_string, **client_kwargs)
+
             self.database = self.client.get_database_client("fraud-agent")
-            
+
             # Existing containers (will be updated with org_id)
             self.claims_container = self.database.get_container_client("claims")
             self.audit_container = self.database.get_container_client("audit-logs")
-            
+
             # NEW: Multi-tenant containers
             self.organizations_container = self.database.get_container_client("organizations")
             self.users_container = self.database.get_container_client("users")
-            
+
+            # Secondary-index containers so login-path lookups are point reads
+            # instead of cross-partition fan-outs:
+            #   tenant-index (PK /azure_tenant_id): azure_tenant_id -> org_id
+            #   user-index   (PK /azure_ad_object_id): azure_ad_object_id -> org_id
+            self.tenant_index_container = self.database.get_container_client("tenant-index")
+            self.user_index_container = self.database.get_container_client("user-index")
+
         except ValueError as e:
             raise ValueError(f"Failed to connect to Cosmos DB: {str(e)}. Expected format: 'AccountEndpoint=https://xxx.documents.azure.com:443/;AccountKey=xxx;'")
         except Exception as e:
             raise ValueError(f"Failed to connect to Cosmos DB: {str(e)}")
-    
+
+    @staticmethod
+    def _build_transport():
+        """aiohttp transport with a tuned connection pool (200 sockets,
+        100 per host, 5-minute DNS cache). Returns None when it can't be
+        built, letting the SDK use its default transport.
+        """
+        try:
+            import aiohttp
+            from azure.core.pipeline.transport import AioHttpTransport
+
+            connector = aiohttp.TCPConnector(
+                limit=200,
+                limit_per_host=100,
+                ttl_dns_cache=300
+            )
+            session = aiohttp.ClientSession(connector=connector)
+            return AioHttpTransport(session=session, session_owner=True)
+        except Exception as e:
+            logger.warning("Falling back to default Cosmos transport: %s", e)
+            return None
+
+    async def ensure_index_containers(self) -> None:
+        """Create the tenant-index / user-index containers if missing.
+
+        get_container_client never creates a container, so on an existing
+        database the login-path point reads would otherwise miss forever and
+        every lookup would pay the failed read, the cross-partition query
+        fallback, and a failed backfill upsert. Idempotent; run at startup.
+        """
+        await asyncio.gather(
+            self.database.create_container_if_not_exists(
+                id="tenant-index",
+                partition_key=PartitionKey(path="/azure_tenant_id")
+            ),
+            self.database.create_container_if_not_exists(
+                id="user-index",
+                partition_key=PartitionKey(path="/azure_ad_object_id")
+            ),
+        )
+
+    async def warmup(self) -> None:
+        """Pre-fetch container metadata so the first user query doesn't pay
+        the address-cache / metadata round trips, and make sure the secondary
+        index containers exist. Called at app startup; failures are non-fatal
+        (the lazy path still works).
+        """
+        try:
+            await self.ensure_index_containers()
+        except Exception as e:
+            logger.warning("Index container setup skipped: %s", e)
+        try:
+            await asyncio.gather(
+                self.claims_container.read(),
+                self.audit_container.read(),
+                self.organizations_container.read(),
+                self.users_container.read(),
+                self.tenant_index_container.read(),
+                self.user_index_container.read(),
+            )
+        except Exception as e:
+            logger.warning("Cosmos warmup skipped: %s", e)
+
     # ========================================================================
     # ORGANIZATION MANAGEMENT
     # ========================================================================
-    
-    def create_organization(self, org_data: Dict[str, Any]) -> Dict[str, Any]:
+
+    async def create_organization(self, org_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new organization"""
         if not org_data.get("org_id"):
-            org_data["org_id"] = f"org_{uuid.uuid4().hex[:12]}"
-        org_data["created_at"] = datetime.utcnow().isoformat()
-        org_data["updated_at"] = datetime.utcnow().isoformat()
-        return self.organizations_container.upsert_item(org_data)
-    
-    def get_organization(self, org_id: str) -> Optional[Dict[str, Any]]:
+            org_data["org_id"] = f"org_{token_hex(6)}"
+        org_data.setdefault("id", org_data["org_id"])
+        org_data.setdefault("claims_count", 0)
+        org_data.setdefault("users_count", 0)
+        now_iso = _utc_now().isoformat()
+        org_data["created_at"] = now_iso
+        org_data["updated_at"] = now_iso
+        self._org_cache.pop(org_data["org_id"], None)
+        saved = await self.organizations_container.upsert_item(org_data)
+        tenant_id = org_data.get("azure_tenant_id")
+        if tenant_id:
+            await self._upsert_tenant_index(tenant_id, org_data["org_id"])
+        return saved
+
+    async def _upsert_tenant_index(self, tenant_id: str, org_id: str) -> None:
+        """Maintain the tenant-index entry; best-effort, the query fallback covers gaps."""
+        try:
+            await self.tenant_index_container.upsert_item({
+                "id": tenant_id,
+                "azure_tenant_id": tenant_id,
+                "org_id": org_id
+            })
+        except Exception as e:
+            logger.warning("tenant-index upsert failed: %s", e)
+
+    async def get_organization(self, org_id: str) -> Optional[Dict[str, Any]]:
         """Get organization by org_id"""
+        cached = self._org_cache.get(org_id)
+        if cached and time.monotonic() < cached[0]:
+            return cached[1]
         try:
             query = "SELECT * FROM c WHERE c.org_id = @org_id"
             params = [{"name": "@org_id", "value": org_id}]
-            items = list(self.organizations_container.query_items(
+            items = [item async for item in self.organizations_container.query_items(
                 query=query,
                 parameters=params,
                 partition_key=org_id
-            ))
-            return items[0] if items else None
+            )]
+            org = items[0] if items else None
+            if org:
+                self._org_cache[org_id] = (time.monotonic() + AUTH_CACHE_TTL_SECONDS, org)
+            return org
         except exceptions.CosmosResourceNotFoundError:
             return None
-    
-    def get_organization_by_tenant_id(self, tenant_id: str) -> Optional[Dict[str, Any]]:
-        """Get organization by Azure AD tenant ID (cross-partition query)"""
+
+    async def get_organization_by_tenant_id(self, tenant_id: str) -> Optional[Dict[str, Any]]:
+        """Get organization by Azure AD tenant ID.
+
+        Point-reads the tenant-index entry (~1 RU) and then does the
+        single-partition org lookup. Orgs created before the index existed
+        fall back to the cross-partition query and are backfilled.
+        """
+        org_id = self._tenant_org_ids.get(tenant_id)
+        if org_id:
+            return await self.get_organization(org_id)
+
+        try:
+            entry = await self.tenant_index_container.read_item(item=tenant_id, partition_key=tenant_id)
+            self._tenant_org_ids[tenant_id] = entry["org_id"]
+            return await self.get_organization(entry["org_id"])
+        except exceptions.CosmosResourceNotFoundError:
+            pass
+        except Exception:
+            pass
+
         try:
             query = "SELECT * FROM c WHERE c.azure_tenant_id = @tenant_id"
             params = [{"name": "@tenant_id", "value": tenant_id}]
-            items = list(self.organizations_container.query_items(
+            items = [item async for item in self.organizations_container.query_items(
                 query=query,
                 parameters=params,
-                enable_cross_partition_query=True
-            ))
-            return items[0] if items else None
+                enable_cross_partition_query=True,
+                max_degree_of_parallelism=-1
+            )]
+            org = items[0] if items else None
+            if org:
+                self._tenant_org_ids[tenant_id] = org["org_id"]
+                await self._upsert_tenant_index(tenant_id, org["org_id"])
+            return org
         except exceptions.CosmosResourceNotFoundError:
             return None
 
-    def update_organization(self, org_id: str, updates: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    async def update_organization(self, org_id: str, updates: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Update organization"""
-        org = self.get_organization(org_id)
+        org = await self.get_organization(org_id)
         if not org:
             return None
         org.update(updates)
-        org["updated_at"] = datetime.utcnow().isoformat()
-        return self.organizations_container.upsert_item(org)
+        org["updated_at"] = _utc_now().isoformat()
+        self._org_cache.pop(org_id, None)
+        return await self.organizations_container.upsert_item(org)
 
-    def update_organization_item(self, org_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def update_organization_item(self, org_data: Dict[str, Any]) -> Dict[str, Any]:
         """Upsert a full organization item"""
-        org_data["updated_at"] = datetime.utcnow().isoformat()
-        return self.organizations_container.upsert_item(org_data)
+        org_data["updated_at"] = _utc_now().isoformat()
+        self._org_cache.pop(org_data.get("org_id"), None)
+        return await self.organizations_container.upsert_item(org_data)
 
-    def update_user(self, user_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def update_user(self, user_data: Dict[str, Any]) -> Dict[str, Any]:
         """Upsert a full user item"""
-        return self.users_container.upsert_item(user_data)
-    
-    def increment_org_claims_count(self, org_id: str) -> None:
-        """Increment claims_count for usage tracking"""
-        org = self.get_organization(org_id)
+        if user_data.get("azure_ad_object_id"):
+            self._aad_user_cache.pop(user_data["azure_ad_object_id"], None)
+        return await self.users_container.upsert_item(user_data)
+
+    async def _increment_org_counter(self, org_id: str, field: str) -> None:
+        """Server-side atomic increment of an org counter — one round trip,
+        no lost-update race. Legacy org docs whose id differs from org_id
+        fall back to read-modify-write.
+        """
+        patch_operations = [
+            {"op": "incr", "path": f"/{field}", "value": 1},
+            {"op": "set", "path": "/updated_at", "value": _utc_now().isoformat()}
+        ]
+        self._org_cache.pop(org_id, None)
+        try:
+            await self.organizations_container.patch_item(
+                item=org_id,
+                partition_key=org_id,
+                patch_operations=patch_operations
+            )
+            return
+        except exceptions.CosmosResourceNotFoundError:
+            pass
+        except exceptions.CosmosHttpResponseError:
+            pass
+
+        org = await self.get_organization(org_id)
         if org:
-            org["claims_count"] = org.get("claims_count", 0) + 1
-            org["updated_at"] = datetime.utcnow().isoformat()
-            self.organizations_container.upsert_item(org)
-    
-    def increment_org_users_count(self, org_id: str) -> None:
+            org[field] = org.get(field, 0) + 1
+            org["updated_at"] = _utc_now().isoformat()
+            await self.organizations_container.upsert_item(org)
+
+    async def increment_org_claims_count(self, org_id: str) -> None:
+        """Increment claims_count for usage tracking"""
+        await self._increment_org_counter(org_id, "claims_count")
+
+    async def increment_org_users_count(self, org_id: str) -> None:
         """Increment users_count for usage tracking"""
-        org = self.get_organization(org_id)
-        if org:
-            org["users_count"] = org.get("users_count", 0) + 1
-            org["updated_at"] = datetime.utcnow().isoformat()
-            self.organizations_container.upsert_item(org)
-    
+        await self._increment_org_counter(org_id, "users_count")
+
     # ========================================================================
     # USER MANAGEMENT
     # ========================================================================
-    
-    def create_user(self, user_data: Dict[str, Any]) -> Dict[str, Any]:
+
+    async def create_user(self, user_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new user"""
         if not user_data.get("user_id"):
-            user_data["user_id"] = f"user_{uuid.uuid4().hex[:12]}"
-        user_data["created_at"] = datetime.utcnow().isoformat()
-        return self.users_container.upsert_item(user_data)
-    
-    def get_user_by_email(self, org_id: str, email: str) -> Optional[Dict[str, Any]]:
+            user_data["user_id"] = f"user_{token_hex(6)}"
+        user_data.setdefault("id", user_data["user_id"])
+        user_data["created_at"] = _utc_now().isoformat()
+        if user_data.get("azure_ad_object_id"):
+            self._aad_user_cache.pop(user_data["azure_ad_object_id"], None)
+        saved = await self.users_container.upsert_item(user_data)
+        azure_ad_object_id = user_data.get("azure_ad_object_id")
+        if azure_ad_object_id and user_data.get("org_id"):
+            await self._upsert_user_index(azure_ad_object_id, user_data["org_id"], user_data["user_id"])
+        return saved
+
+    async def _upsert_user_index(self, azure_ad_object_id: str, org_id: str, user_id: str) -> None:
+        """Maintain the user-index entry; best-effort, the query fallback covers gaps."""
+        try:
+            await self.user_index_container.upsert_item({
+                "id": azure_ad_object_id,
+                "azure_ad_object_id": azure_ad_object_id,
+                "org_id": org_id,
+                "user_id": user_id
+            })
+        except Exception as e:
+            logger.warning("user-index upsert failed: %s", e)
+
+    async def get_user_by_email(self, org_id: str, email: str) -> Optional[Dict[str, Any]]:
         """Get user by email within an organization"""
         try:
             query = "SELECT * FROM c WHERE c.org_id = @org_id AND c.email = @email"
@@ -152,210 +382,574 @@ class CosmosDBService:
                 {"name": "@org_id", "value": org_id},
                 {"name": "@email", "value": email.lower()}
             ]
-            items = list(self.users_container.query_items(
+            items = [item async for item in self.users_container.query_items(
                 query=query,
                 parameters=params,
                 partition_key=org_id
-            ))
+            )]
             return items[0] if items else None
         except exceptions.CosmosResourceNotFoundError:
             return None
-    
-    def get_user_by_azure_ad_id(self, azure_ad_object_id: str) -> Optional[Dict[str, Any]]:
-        """Get user by Azure AD object ID (cross-partition query)"""
+
+    async def get_user_by_azure_ad_id(self, azure_ad_object_id: str) -> Optional[Dict[str, Any]]:
+        """Get user by Azure AD object ID.
+
+        Point-reads the user-index entry to learn the org_id, then does a
+        single-partition lookup in users. Users created before the index
+        existed fall back to the cross-partition query and are backfilled.
+        Warm results come from the in-process TTL cache.
+        """
+        cached = self._aad_user_cache.get(azure_ad_object_id)
+        if cached and time.monotonic() < cached[0]:
+            return cached[1]
         try:
+            entry = await self.user_index_container.read_item(
+                item=azure_ad_object_id, partition_key=azure_ad_object_id
+            )
             query = "SELECT * FROM c WHERE c.azure_ad_object_id = @azure_ad_object_id"
             params = [{"name": "@azure_ad_object_id", "value": azure_ad_object_id}]
-            items = list(self.users_container.query_items(
+            items = [item async for item in self.users_container.query_items(
                 query=query,
                 parameters=params,
-                enable_cross_partition_query=True
-            ))
-            return items[0] if items else None
+                partition_key=entry["org_id"]
+            )]
+            if items:
+                self._aad_user_cache[azure_ad_object_id] = (
+                    time.monotonic() + AUTH_CACHE_TTL_SECONDS, items[0]
+                )
+                return items[0]
+        except exceptions.CosmosResourceNotFoundError:
+            pass
+        except Exception:
+            pass
+
+        try:
+            query = "SELECT * FROM c WHERE c.azure_ad_object_id = @azure_ad_object_id"
+            params = [{"name": "@azure_ad_object_id", "value": azure_ad_object_id}]
+            items = [item async for item in self.users_container.query_items(
+                query=query,
+                parameters=params,
+                enable_cross_partition_query=True,
+                max_degree_of_parallelism=-1
+            )]
+            user = items[0] if items else None
+            if user and user.get("org_id"):
+                self._aad_user_cache[azure_ad_object_id] = (
+                    time.monotonic() + AUTH_CACHE_TTL_SECONDS, user
+                )
+                await self._upsert_user_index(azure_ad_object_id, user["org_id"], user.get("user_id"))
+            return user
         except exceptions.CosmosResourceNotFoundError:
             return None
-    
-    def update_user_last_login(self, org_id: str, user_id: str) -> None:
-        """Update user's last login timestamp"""
+
+    async def update_user_last_login(self, org_id: str, user_id: str) -> None:
+        """Update user's last login timestamp.
+
+        User docs store id == user_id, so this is a single PATCH instead of
+        query+upsert. Legacy docs with a different id fall back to the old path.
+        """
+        try:
+            await self.users_container.patch_item(
+                item=user_id,
+                partition_key=org_id,
+                patch_operations=[
+                    {"op": "set", "path": "/last_login", "value": _utc_now().isoformat()}
+                ]
+            )
+            return
+        except exceptions.CosmosResourceNotFoundError:
+            pass
+        except Exception:
+            pass
+
         try:
             query = "SELECT * FROM c WHERE c.org_id = @org_id AND c.user_id = @user_id"
             params = [
                 {"name": "@org_id", "value": org_id},
                 {"name": "@user_id", "value": user_id}
             ]
-            items = list(self.users_container.query_items(
+            items = [item async for item in self.users_container.query_items(
                 query=query,
                 parameters=params,
                 partition_key=org_id
-            ))
+            )]
             if items:
                 user = items[0]
-                user["last_login"] = datetime.utcnow().isoformat()
-                self.users_container.upsert_item(user)
+                user["last_login"] = _utc_now().isoformat()
+                await self.users_container.upsert_item(user)
         except Exception:
             pass
-    
-    def list_org_users(self, org_id: str) -> List[Dict[str, Any]]:
+
+    async def list_org_users(self, org_id: str) -> List[Dict[str, Any]]:
         """List all users in an organization"""
         query = "SELECT * FROM c WHERE c.org_id = @org_id"
         params = [{"name": "@org_id", "value": org_id}]
-        items = list(self.users_container.query_items(
+        items = [item async for item in self.users_container.query_items(
             query=query,
             parameters=params,
             partition_key=org_id
-        ))
+        )]
         return items
-    
+
     # ========================================================================
     # CLAIMS MANAGEMENT (Multi-Tenant)
     # ========================================================================
-    
-    def save_claim(self, claim: Dict[str, Any]) -> Dict[str, Any]:
+
+    async def save_claim(self, claim: Dict[str, Any]) -> Dict[str, Any]:
         """Save/Update claim - org_id required for new claims, optional for legacy updates"""
-        claim["updated_at"] = datetime.utcnow().isoformat()
+        claim["updated_at"] = _utc_now().isoformat()
         # Set default org_id if missing (backward compatibility)
         if not claim.get("org_id"):
             claim["org_id"] = "org_default"
-        return self.claims_container.upsert_item(claim)
-    
-    def get_claim(self, org_id: str, claim_id: str) -> Optional[Dict[str, Any]]:
-        """Get claim by claim_id within organization. Partition key is /claim_id."""
+        # New docs use id == claim_id so get_claim can point-read them
+        if not claim.get("id"):
+            claim["id"] = claim.get("claim_id")
+        self._claim_cache.pop(claim.get("claim_id"), None)
+        return await self.claims_container.upsert_item(claim)
+
+    async def get_claim(self, org_id: str, claim_id: str) -> Optional[Dict[str, Any]]:
+        """Get claim by claim_id within organization. Partition key is /claim_id.
+
+        New claims store id == claim_id, so this is usually a ~1 RU point
+        read; legacy claims with a uuid id fall through to the
+        single-partition query.
+        """
+        try:
+            claim = await self.claims_container.read_item(item=claim_id, partition_key=claim_id)
+            if claim.get("org_id") == org_id:
+                return claim
+        except exceptions.CosmosResourceNotFoundError:
+            pass
+        except Exception:
+            pass
+
         try:
             query = "SELECT * FROM c WHERE c.org_id = @org_id AND c.claim_id = @claim_id"
             params = [
                 {"name": "@org_id", "value": org_id},
                 {"name": "@claim_id", "value": claim_id}
             ]
-            items = list(self.claims_container.query_items(
+            items = [item async for item in self.claims_container.query_items(
                 query=query,
                 parameters=params,
                 partition_key=claim_id
-            ))
+            )]
             return items[0] if items else None
         except exceptions.CosmosResourceNotFoundError:
             return None
-    
-    def get_claim_by_id(self, org_id: str, id: str) -> Optional[Dict[str, Any]]:
-        """Get claim by internal ID within organization. Cross-partition since we don't have claim_id."""
+
+    async def get_claim_cached(self, org_id: str, claim_id: str) -> Optional[Dict[str, Any]]:
+        """get_claim behind a short TTL cache for read-only callers.
+
+        Returns a shallow copy (with copied document entries) so handlers can
+        attach audit logs or SAS URLs without mutating the cached doc.
+        Writes through save_claim/update_claim/delete_claim invalidate the
+        entry; misses and None results are not cached.
+        """
+        cached = self._claim_cache.get(claim_id)
+        if cached and time.monotonic() < cached[0]:
+            claim = cached[1]
+        else:
+            claim = await self.get_claim(org_id, claim_id)
+            if claim is None:
+                return None
+            if len(self._claim_cache) >= CLAIM_CACHE_MAX_ENTRIES:
+                self._claim_cache.clear()
+            self._claim_cache[claim_id] = (time.monotonic() + CLAIM_CACHE_TTL_SECONDS, claim)
+        if claim.get("org_id") != org_id:
+            return None
+        copy = dict(claim)
+        copy["documents"] = [dict(doc) for doc in claim.get("documents", [])]
+        return copy
+
+    async def get_claim_by_id(self, org_id: str, id: str, claim_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Get claim by internal ID within organization.
+
+        When the caller also knows the claim_id (the partition key), this is a
+        ~1 RU point read. Without it we fall back to a cross-partition query.
+        """
+        if claim_id:
+            try:
+                claim = await self.claims_container.read_item(item=id, partition_key=claim_id)
+                return claim if claim.get("org_id") == org_id else None
+            except exceptions.CosmosResourceNotFoundError:
+                return None
         try:
             query = "SELECT * FROM c WHERE c.org_id = @org_id AND c.id = @id"
             params = [
                 {"name": "@org_id", "value": org_id},
                 {"name": "@id", "value": id}
             ]
-            items = list(self.claims_container.query_items(
+            items = [item async for item in self.claims_container.query_items(
                 query=query,
                 parameters=params,
-                enable_cross_partition_query=True
-            ))
+                enable_cross_partition_query=True,
+                max_degree_of_parallelism=-1
+            )]
             return items[0] if items else None
         except exceptions.CosmosResourceNotFoundError:
             return None
-    
-    def list_claims(self, org_id: str, limit: int = 100) -> List[Dict[str, Any]]:
-        """List claims for a specific organization. Cross-partition since partition key is /claim_id."""
-        query = "SELECT * FROM c WHERE c.org_id = @org_id ORDER BY c.fraud_score DESC OFFSET 0 LIMIT @limit"
+
+    async def list_claims(
+        self,
+        org_id: str,
+        limit: int = 100,
+        continuation_token: Optional[str] = None
+    ) -> tuple[List[Dict[str, Any]], Optional[str]]:
+        """List one page of claims for an organization, highest fraud score first.
+
+        The cursor is an explicit offset (returned as an opaque string token),
+        not an SDK continuation token: cross-partition ORDER BY queries run
+        through the SDK's client-side merge, whose per-partition continuation
+        tokens are not resumable once the container spans multiple physical
+        partitions. OFFSET/LIMIT is executed server-side per partition, so
+        pages stay correct at any scale; deep pages pay RU for the skipped
+        rows, which is acceptable at the dashboard's page sizes.
+
+        Returns (items, next_token); next_token is None when there are no
+        further pages. Raises ValueError for a malformed token.
+        """
+        try:
+            offset = int(continuation_token) if continuation_token else 0
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid continuation token: {continuation_token!r}")
+        if offset < 0:
+            raise ValueError(f"Invalid continuation token: {continuation_token!r}")
+
+        query = (
+            f"SELECT {CLAIM_LIST_PROJECTION} FROM c WHERE c.org_id = @org_id"
+            " ORDER BY c.fraud_score DESC OFFSET @offset LIMIT @limit"
+        )
         params = [
             {"name": "@org_id", "value": org_id},
+            {"name": "@offset", "value": offset},
             {"name": "@limit", "value": limit}
         ]
-        items = list(self.claims_container.query_items(
+        items = [item async for item in self.claims_container.query_items(
             query=query,
             parameters=params,
-            enable_cross_partition_query=True
-        ))
-        return sorted(items, key=lambda x: x.get("fraud_score", 0) or 0, reverse=True)
-    
-    def list_claims_last_24h(self, org_id: str) -> List[Dict[str, Any]]:
+            enable_cross_partition_query=True,
+            max_degree_of_parallelism=-1,
+            max_item_count=limit
+        )]
+        # A short page means the result set is exhausted; a full page may
+        # have more (worst case the next fetch returns an empty last page)
+        next_token = str(offset + limit) if len(items) == limit else None
+        return items, next_token
+
+    async def list_claims_last_24h(self, org_id: str) -> List[Dict[str, Any]]:
         """List claims from last 24 hours for a specific organization"""
-        cutoff = (datetime.utcnow() - timedelta(hours=24)).isoformat()
-        query = "SELECT * FROM c WHERE c.org_id = @org_id AND c.created_at >= @cutoff ORDER BY c.fraud_score DESC"
+        cutoff = (_utc_now() - timedelta(hours=24)).isoformat()
+        query = f"SELECT {CLAIM_LIST_PROJECTION} FROM c WHERE c.org_id = @org_id AND c.created_at >= @cutoff ORDER BY c.fraud_score DESC"
         params = [
             {"name": "@org_id", "value": org_id},
             {"name": "@cutoff", "value": cutoff}
         ]
-        items = list(self.claims_container.query_items(
+        items = [item async for item in self.claims_container.query_items(
             query=query,
             parameters=params,
-            enable_cross_partition_query=True
-        ))
+            enable_cross_partition_query=True,
+            max_degree_of_parallelism=-1,
+            max_item_count=-1
+        )]
         return items
-    
-    def update_claim(self, org_id: str, claim_id: str, updates: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Update claim within organization"""
-        claim = self.get_claim(org_id, claim_id)
+
+    async def count_claims_since(self, org_id: str, cutoff_iso: str) -> int:
+        """Count an org's claims created at or after cutoff_iso.
+
+        Server-side COUNT, so the result is exact regardless of page sizes
+        and only a scalar crosses the wire.
+        """
+        return await self._query_claims_scalar(
+            "SELECT VALUE COUNT(1) FROM c WHERE c.org_id = @org_id AND c.created_at >= @cutoff",
+            [
+                {"name": "@org_id", "value": org_id},
+                {"name": "@cutoff", "value": cutoff_iso}
+            ]
+        )
+
+    async def update_claim(self, org_id: str, claim_id: str, updates: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Update claim within organization.
+
+        Tries a server-side partial update (PATCH) first — one atomic round
+        trip instead of read+merge+upsert. The PATCH addresses the document by
+        id, which for new claims equals claim_id; a filter predicate keeps the
+        org_id isolation the read path enforces (a mismatch fails the
+        precondition and falls through, like legacy documents with a separate
+        uuid id, to the read-modify-write path, which then returns None).
+        """
+        self._claim_cache.pop(claim_id, None)
+        patch_operations = [
+            {"op": "set", "path": f"/{field}", "value": value}
+            for field, value in updates.items()
+        ]
+        patch_operations.append(
+            {"op": "set", "path": "/updated_at", "value": _utc_now().isoformat()}
+        )
+        try:
+            return await self.claims_container.patch_item(
+                item=claim_id,
+                partition_key=claim_id,
+                patch_operations=patch_operations,
+                filter_predicate=f"FROM c WHERE c.org_id = '{org_id}'"
+            )
+        except exceptions.CosmosResourceNotFoundError:
+            pass
+        except exceptions.CosmosHttpResponseError:
+            pass
+
+        claim = await self.get_claim(org_id, claim_id)
         if not claim:
             return None
         claim.update(updates)
-        claim["updated_at"] = datetime.utcnow().isoformat()
-        return self.claims_container.upsert_item(claim)
-    
-    def delete_claim(self, org_id: str, claim_id: str, id: str) -> bool:
+        claim["updated_at"] = _utc_now().isoformat()
+        return await self.claims_container.upsert_item(claim)
+
+    async def delete_claim(self, org_id: str, claim_id: str, id: str) -> bool:
         """Delete claim within organization. Partition key is /claim_id."""
+        self._claim_cache.pop(claim_id, None)
         try:
-            self.claims_container.delete_item(item=id, partition_key=claim_id)
+            await self.claims_container.delete_item(item=id, partition_key=claim_id)
             return True
         except exceptions.CosmosResourceNotFoundError:
             return False
-    
+
     # ========================================================================
     # AUDIT LOGS (Multi-Tenant)
     # ========================================================================
-    
-    def save_audit_log(self, audit_log: Dict[str, Any]) -> Dict[str, Any]:
+
+    async def save_audit_log(self, audit_log: Dict[str, Any]) -> Dict[str, Any]:
         """Save audit log - org_id set to default if missing"""
         if not audit_log.get("org_id"):
             audit_log["org_id"] = "org_default"
-        return self.audit_container.upsert_item(audit_log)
-    
-    def get_audit_logs(self, org_id: str, claim_id: str) -> List[Dict[str, Any]]:
+        saved = await self.audit_container.upsert_item(audit_log)
+        # Audits are append-only, so keep a denormalized per-day counter
+        # current instead of re-scanning today's logs on every dashboard hit
+        if audit_log.get("action_type") == "OVERRIDE":
+            await self._increment_override_counter(audit_log["org_id"])
+        return saved
+
+    async def save_audit_logs(self, audit_logs: List[Dict[str, Any]]) -> None:
+        """Save several audit logs for one claim in a single round-trip.
+
+        All logs must share the same claim_id (the partition key), which lets
+        them go through one transactional batch instead of one write each.
+        """
+        if not audit_logs:
+            return
+        if len(audit_logs) == 1:
+            await self.save_audit_log(audit_logs[0])
+            return
+
+        claim_id = audit_logs[0]["claim_id"]
+        for audit_log in audit_logs:
+            if not audit_log.get("org_id"):
+                audit_log["org_id"] = "org_default"
+        await self.audit_container.execute_item_batch(
+            batch_operations=[("upsert", (log,)) for log in audit_logs],
+            partition_key=claim_id
+        )
+        for audit_log in audit_logs:
+            if audit_log.get("action_type") == "OVERRIDE":
+                await self._increment_override_counter(audit_log["org_id"])
+
+    def _override_counter_keys(self, org_id: str, day: str) -> tuple[str, str]:
+        """(id, partition key) for the per-day OVERRIDE counter document."""
+        return f"overrides::{org_id}::{day}", f"override-counter::{org_id}"
+
+    async def _count_overrides_by_query(self, org_id: str, day: str) -> int:
+        """Server-side COUNT of a day's OVERRIDE audit logs.
+
+        ISO-8601 timestamps sort lexicographically, so the half-open range
+        [dayT00:00:00, next-day T00:00:00) covers exactly that day's logs.
+        """
+        next_day = (datetime.fromisoformat(day) + timedelta(days=1)).date().isoformat()
+        query = (
+            "SELECT VALUE COUNT(1) FROM c WHERE c.org_id = @org_id"
+            " AND c.action_type = 'OVERRIDE'"
+            " AND c.timestamp >= @day_start AND c.timestamp < @day_end"
+        )
+        params = [
+            {"name": "@org_id", "value": org_id},
+            {"name": "@day_start", "value": day + "T00:00:00"},
+            {"name": "@day_end", "value": next_day + "T00:00:00"}
+        ]
+        results = [item async for item in self.audit_container.query_items(
+            query=query,
+            parameters=params,
+            enable_cross_partition_query=True,
+            max_degree_of_parallelism=-1
+        )]
+        return results[0] if results else 0
+
+    async def _increment_override_counter(self, org_id: str) -> None:
+        """Bump today's OVERRIDE counter document (O(1) vs. rescanning audits)."""
+        day = _utc_now().date().isoformat()
+        doc_id, counter_pk = self._override_counter_keys(org_id, day)
+        try:
+            await self.audit_container.patch_item(
+                item=doc_id,
+                partition_key=counter_pk,
+                patch_operations=[{"op": "incr", "path": "/count", "value": 1}]
+            )
+        except exceptions.CosmosResourceNotFoundError:
+            # No counter doc yet for today (first deploy day, or a gap).
+            # Seed from a count of today's OVERRIDE logs so the ones written
+            # before the counter existed aren't dropped; the audit that
+            # triggered this bump is already persisted, so the count
+            # includes it.
+            seed = max(await self._count_overrides_by_query(org_id, day), 1)
+            try:
+                await self.audit_container.create_item({
+                    "id": doc_id,
+                    "claim_id": counter_pk,
+                    "org_id": org_id,
+                    "type": "override_counter",
+                    "date": day,
+                    "count": seed
+                })
+            except exceptions.CosmosResourceExistsError:
+                # Lost the create race; the other writer's doc exists now
+                await self.audit_container.patch_item(
+                    item=doc_id,
+                    partition_key=counter_pk,
+                    patch_operations=[{"op": "incr", "path": "/count", "value": 1}]
+                )
+        except Exception as e:
+            # Counter is an optimization; never fail the audit write over it
+            logger.warning("Override counter update failed: %s", e)
+
+    async def get_audit_logs(self, org_id: str, claim_id: str) -> List[Dict[str, Any]]:
         """Get audit logs for a claim within organization. Partition key is /claim_id."""
         query = "SELECT * FROM c WHERE c.org_id = @org_id AND c.claim_id = @claim_id ORDER BY c.timestamp DESC"
         params = [
             {"name": "@org_id", "value": org_id},
             {"name": "@claim_id", "value": claim_id}
         ]
-        items = list(self.audit_container.query_items(
+        items = [item async for item in self.audit_container.query_items(
             query=query,
             parameters=params,
-            partition_key=claim_id
-        ))
+            partition_key=claim_id,
+            max_item_count=-1
+        )]
         return items
-    
+
     # ========================================================================
     # STATISTICS (Multi-Tenant)
     # ========================================================================
-    
-    def get_stats(self, org_id: str) -> Dict[str, Any]:
-        """Get statistics for a specific organization"""
-        claims = self.list_claims(org_id, 1000)
-        now = datetime.utcnow()
+
+    async def count_overrides_today(self, org_id: str) -> int:
+        """Count today's OVERRIDE audit logs.
+
+        Point-reads the denormalized per-day counter maintained by
+        save_audit_log (~1 RU). Days without a counter document fall back to
+        a single server-side COUNT query over the range index.
+        """
+        today = _utc_now().date().isoformat()
+        doc_id, counter_pk = self._override_counter_keys(org_id, today)
+        try:
+            counter = await self.audit_container.read_item(item=doc_id, partition_key=counter_pk)
+            return counter.get("count", 0)
+        except exceptions.CosmosResourceNotFoundError:
+            pass
+        except Exception:
+            pass
+
+        return await self._count_overrides_by_query(org_id, today)
+
+    async def _query_claims_scalar(self, query: str, params: List[Dict[str, Any]], default=0):
+        """Run an aggregate query against claims that returns a single scalar."""
+        results = [item async for item in self.claims_container.query_items(
+            query=query,
+            parameters=params,
+            enable_cross_partition_query=True,
+            max_degree_of_parallelism=-1
+        )]
+        value = results[0] if results else None
+        return default if value is None else value
+
+    async def _query_claims_group_counts(self, field: str, params: List[Dict[str, Any]]) -> Dict[str, int]:
+        """Count claims per value of a field with one server-side GROUP BY.
+
+        `field` is an internal literal ('risk_band' / 'status'), never user input.
+        """
+        query = (
+            f"SELECT c.{field} AS value, COUNT(1) AS cnt FROM c"
+            f" WHERE c.org_id = @org_id GROUP BY c.{field}"
+        )
+        results = [item async for item in self.claims_container.query_items(
+            query=query,
+            parameters=params,
+            enable_cross_partition_query=True,
+            max_degree_of_parallelism=-1
+        )]
+        return {row["value"]: row["cnt"] for row in results if row.get("value") is not None}
+
+    async def get_stats(self, org_id: str) -> Dict[str, Any]:
+        """Get statistics for a specific organization.
+
+        All counters are computed server-side with aggregate queries so only
+        scalars cross the wire instead of up to 1000 full claim documents.
+        Results are cached in-process for a short TTL since the dashboard
+        polls this endpoint.
+        """
+        cached = self._stats_cache.get(org_id)
+        if cached and time.monotonic() < cached[0]:
+            return cached[1]
+
+        now = _utc_now()
         this_month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0).isoformat()
         last_24h = (now - timedelta(hours=24)).isoformat()
-        
-        high_risk = sum(1 for c in claims if c.get("risk_band") == "high")
-        medium_risk = sum(1 for c in claims if c.get("risk_band") == "medium")
-        low_risk = sum(1 for c in claims if c.get("risk_band") == "low")
-        
-        needs_review = sum(1 for c in claims if c.get("status") == "needs_review")
-        approved = sum(1 for c in claims if c.get("status") == "approved")
-        rejected = sum(1 for c in claims if c.get("status") == "rejected")
-        
-        claims_this_month = sum(1 for c in claims if c.get("created_at", "") >= this_month_start)
-        claims_last_24h = sum(1 for c in claims if c.get("created_at", "") >= last_24h)
-        
-        scored_claims = [c for c in claims if c.get("fraud_score") is not None]
-        avg_score = 0.0
-        if scored_claims:
-            avg_score = sum(c.get("fraud_score", 0) for c in scored_claims) / len(scored_claims)
-        
-        total_value = sum(c.get("claim_amount_gbp", 0) or 0 for c in claims)
-        
-        return {
-            "total_claims": len(claims),
-            "high_risk_claims": high_risk,
-            "medium_risk_claims": medium_risk,
-            "low_risk_claims": low_risk,
+
+        params = [{"name": "@org_id", "value": org_id}]
+        count_base = "SELECT VALUE COUNT(1) FROM c WHERE c.org_id = @org_id"
+
+        # Run the aggregate queries concurrently — total latency is ~one round
+        # trip instead of one per counter. Risk-band and status breakdowns each
+        # come back from a single GROUP BY instead of one COUNT per value.
+        (
+            total_claims,
+            risk_counts,
+            status_counts,
+            claims_this_month,
+            claims_last_24h,
+            avg_score,
+            total_value,
+            overrides_today,
+        ) = await asyncio.gather(
+            self._query_claims_scalar(count_base, params),
+            self._query_claims_group_counts("risk_band", params),
+            self._query_claims_group_counts("status", params),
+            self._query_claims_scalar(
+                count_base + " AND c.created_at >= @cutoff",
+                params + [{"name": "@cutoff", "value": this_month_start}]
+            ),
+            self._query_claims_scalar(
+                count_base + " AND c.created_at >= @cutoff",
+                params + [{"name": "@cutoff", "value": last_24h}]
+            ),
+            self._query_claims_scalar(
+                "SELECT VALUE AVG(c.fraud_score) FROM c WHERE c.org_id = @org_id AND IS_NUMBER(c.fraud_score)",
+                params,
+                default=0.0
+            ),
+            self._query_claims_scalar(
+                "SELECT VALUE SUM(c.claim_amount_gbp) FROM c WHERE c.org_id = @org_id AND IS_NUMBER(c.claim_amount_gbp)",
+                params,
+                default=0
+            ),
+            self.count_overrides_today(org_id),
+        )
+
+        needs_review = status_counts.get("needs_review", 0)
+        approved = status_counts.get("approved", 0)
+        rejected = status_counts.get("rejected", 0)
+
+        stats = {
+            "total_claims": total_claims,
+            "high_risk_claims": risk_counts.get("high", 0),
+            "medium_risk_claims": risk_counts.get("medium", 0),
+            "low_risk_claims": risk_counts.get("low", 0),
             "pending_review": needs_review,
             "needs_review_count": needs_review,
             "approved_count": approved,
@@ -364,14 +958,54 @@ class CosmosDBService:
             "claims_this_month": claims_this_month,
             "claims_last_24h": claims_last_24h,
             "average_score": round(avg_score, 1),
-            "total_value_gbp": total_value
+            "total_value_gbp": total_value,
+            "overrides_today": overrides_today
         }
-    
+
+        self._stats_cache[org_id] = (time.monotonic() + STATS_CACHE_TTL_SECONDS, stats)
+        return stats
+
     # ========================================================================
     # DATA MIGRATION
     # ========================================================================
-    
-    def migrate_existing_claims_to_org(self, org_id: str) -> Dict[str, Any]:
+
+    async def ensure_claims_indexes(self) -> Dict[str, Any]:
+        """
+        Migration script: add composite indexes so the list queries
+        (org_id + ORDER BY fraud_score, org_id + created_at filter) are
+        served from the index instead of a cross-partition sort.
+        Run this ONCE; re-running is a no-op apart from the container read.
+        """
+        composite_indexes = [
+            [
+                {"path": "/org_id", "order": "ascending"},
+                {"path": "/fraud_score", "order": "descending"}
+            ],
+            [
+                {"path": "/org_id", "order": "ascending"},
+                {"path": "/created_at", "order": "descending"}
+            ]
+        ]
+        try:
+            container = await self.claims_container.read()
+            indexing_policy = container.get("indexingPolicy", {})
+            if indexing_policy.get("compositeIndexes") == composite_indexes:
+                return {"success": True, "changed": False}
+
+            indexing_policy["compositeIndexes"] = composite_indexes
+            await self.database.replace_container(
+                self.claims_container,
+                partition_key=PartitionKey(path="/claim_id"),
+                indexing_policy=indexing_policy
+            )
+            return {"success": True, "changed": True}
+        except Exception as e:
+            return {
+                "success": False,
+                "error": str(e)
+            }
+
+    async def migrate_existing_claims_to_org(self, org_id: str) -> Dict[str, Any]:
         """
         Migration script: Assign all existing claims (without org_id) to an organization
         Run this ONCE after creating your first organization
@@ -379,18 +1013,21 @@ class CosmosDBService:
         try:
             # Find all claims without org_id
             query = "SELECT * FROM c WHERE NOT IS_DEFINED(c.org_id)"
-            items = list(self.claims_container.query_items(
-                query=query,
-                enable_cross_partition_query=True
-            ))
-            
+
+            # Stream instead of materializing — only one claim resident at a
+            # time. One timestamp covers the whole batch.
             migrated_count = 0
-            for claim in items:
+            now_iso = _utc_now().isoformat()
+            async for claim in self.claims_container.query_items(
+                query=query,
+                enable_cross_partition_query=True,
+                max_degree_of_parallelism=-1
+            ):
                 claim["org_id"] = org_id
-                claim["updated_at"] = datetime.utcnow().isoformat()
-                self.claims_container.upsert_item(claim)
+                claim["updated_at"] = now_iso
+                await self.claims_container.upsert_item(claim)
                 migrated_count += 1
-            
+
             return {
                 "success": True,
                 "migrated_claims": migrated_count,
@@ -401,8 +1038,8 @@ class CosmosDBService:
                 "success": False,
                 "error": str(e)
             }
-    
-    def migrate_existing_audit_logs_to_org(self, org_id: str) -> Dict[str, Any]:
+
+    async def migrate_existing_audit_logs_to_org(self, org_id: str) -> Dict[str, Any]:
         """
         Migration script: Assign all existing audit logs (without org_id) to an organization
         Run this ONCE after creating your first organization
@@ -410,17 +1047,43 @@ class CosmosDBService:
         try:
             # Find all audit logs without org_id
             query = "SELECT * FROM c WHERE NOT IS_DEFINED(c.org_id)"
-            items = list(self.audit_container.query_items(
-                query=query,
-                enable_cross_partition_query=True
-            ))
-            
+
+            # Audit logs share /claim_id partitions, so group the writes and
+            # submit a transactional batch per claim (up to 100 ops per round
+            # trip) instead of one upsert per log
             migrated_count = 0
-            for log in items:
+            pending: Dict[str, List] = {}
+            async for log in self.audit_container.query_items(
+                query=query,
+                enable_cross_partition_query=True,
+                max_degree_of_parallelism=-1
+            ):
                 log["org_id"] = org_id
-                self.audit_container.upsert_item(log)
-                migrated_count += 1
-            
+                claim_id = log.get("claim_id")
+                if not claim_id:
+                    await self.audit_container.upsert_item(log)
+                    migrated_count += 1
+                    continue
+                ops = pending.setdefault(claim_id, [])
+                ops.append(("upsert", (log,)))
+                if len(ops) >= 100:
+                    await self.audit_container.execute_item_batch(
+                        batch_operations=ops, partition_key=claim_id
+                    )
+                    migrated_count += len(ops)
+                    pending[claim_id] = []
+
+            for claim_id, ops in pending.items():
+                if not ops:
+                    continue
+                if len(ops) == 1:
+                    await self.audit_container.upsert_item(ops[0][1][0])
+                else:
+                    await self.audit_container.execute_item_batch(
+                        batch_operations=ops, partition_key=claim_id
+                    )
+                migrated_count += len(ops)
+
             return {
                 "success": True,
                 "migrated_audit_logs": migrated_count,
@@ -432,11 +1095,15 @@ class CosmosDBService:
                 "error": str(e)
             }
 
-# Singleton instance
+# Singleton instance - the CosmosClient must be shared per process so its
+# connection pool and cached container metadata are reused across requests
 cosmos_db: Optional[CosmosDBService] = None
+_cosmos_db_lock = threading.Lock()
 
 def get_cosmos_db() -> CosmosDBService:
     global cosmos_db
     if cosmos_db is None:
-        cosmos_db = CosmosDBService()
+        with _cosmos_db_lock:
+            if cosmos_db is None:
+                cosmos_db = CosmosDBService()
     return cosmos_db
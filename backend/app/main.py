@@ -1,32 +1,84 @@
+import logging
 import os
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from dotenv import load_dotenv
 
 # Load environment variables if present
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 from .routers import auth, claims, organizations
 
 app = FastAPI(
     title="Synapx AI API",
     description="Fraud Prediction AI Agent",
-    version="2.0.0"
+    version="2.0.0",
+    # Rust-backed JSON encoder — large claim-list responses serialize several
+    # times faster than with the stdlib json module
+    default_response_class=ORJSONResponse
 )
 
+class FastCORSMiddleware(CORSMiddleware):
+    """CORSMiddleware with an O(1) origin check.
+
+    Starlette scans allow_origins linearly per request; with a frozenset the
+    membership test is a single hash lookup.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._allow_origins_set = frozenset(self.allow_origins)
+
+    def is_allowed_origin(self, origin: str) -> bool:
+        if self.allow_all_origins:
+            return True
+        return origin in self._allow_origins_set
+
+
 # Explicitly allow your frontend URL to make requests to this API
-# Using ["*"] is okay for development, but listing the URL is safer for production
+# Using ["*"] is okay for development, but listing the URL is safer for production.
+# Overridable per environment via ALLOWED_ORIGINS (comma-separated).
+DEFAULT_ALLOWED_ORIGINS = (
+    "https://thankful-forest-080eaad03.6.azurestaticapps.net,"
+    "http://localhost:5000"
+)
+allowed_origins = [
+    origin.strip()
+    for origin in os.environ.get("ALLOWED_ORIGINS", DEFAULT_ALLOWED_ORIGINS).split(",")
+    if origin.strip()
+]
+
 app.add_middleware(
-    CORSMiddleware,
-    allow_origins=[
-        "https://thankful-forest-080eaad03.6.azurestaticapps.net",
-        "http://localhost:5000"
-    ],
+    FastCORSMiddleware,
+    allow_origins=allowed_origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Continuation-Token"],  # claims list pagination
+    max_age=86400,  # let browsers cache preflight responses for a day
 )
 
+# Claim-list and stats JSON is highly repetitive, so gzip cuts the wire size
+# several-fold; tiny responses are left uncompressed
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+@app.on_event("startup")
+async def warm_cosmos():
+    # Build the Cosmos client once at startup (before any request can race
+    # the singleton), expose it on app.state for tests/overrides, and
+    # pre-fetch container metadata so the first real request doesn't pay
+    # connection/metadata latency
+    try:
+        from .db.cosmos import get_cosmos_db
+        app.state.cosmos = get_cosmos_db()
+        await app.state.cosmos.warmup()
+    except Exception as e:
+        logger.warning("Cosmos warmup failed (will connect lazily): %s", e)
+
 # Include routers for different modules
 app.include_router(auth.router)
 app.include_router(claims.router)
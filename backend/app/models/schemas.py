@@ -1,27 +1,58 @@
-from pydantic import BaseModel, Field
-from typing import Optional, List, Literal
+from enum import StrEnum
+
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Optional, List
 from datetime import datetime
 import uuid
 
-AccidentType = Literal[
-    "Collision", "Rear-End", "Side Impact", "Rollover", "Hit and Run",
-    "Parking Damage", "Theft", "Vandalism", "Fire", "Flood Damage"
-]
+# StrEnum instead of Literal unions: members behave as plain strings on the
+# wire and in comparisons, but Pydantic validates them via its fast enum path
+
+class AccidentType(StrEnum):
+    COLLISION = "Collision"
+    REAR_END = "Rear-End"
+    SIDE_IMPACT = "Side Impact"
+    ROLLOVER = "Rollover"
+    HIT_AND_RUN = "Hit and Run"
+    PARKING_DAMAGE = "Parking Damage"
+    THEFT = "Theft"
+    VANDALISM = "Vandalism"
+    FIRE = "Fire"
+    FLOOD_DAMAGE = "Flood Damage"
 
-ActionType = Literal[
-    "SCORE_GENERATED", "OVERRIDE", "FIELD_EDIT", "STATUS_CHANGE", 
-    "CLAIM_CREATED", "DOCUMENT_UPLOADED", "RESCORE", "APPROVE", "REJECT"
-]
+class ActionType(StrEnum):
+    SCORE_GENERATED = "SCORE_GENERATED"
+    OVERRIDE = "OVERRIDE"
+    FIELD_EDIT = "FIELD_EDIT"
+    STATUS_CHANGE = "STATUS_CHANGE"
+    CLAIM_CREATED = "CLAIM_CREATED"
+    DOCUMENT_UPLOADED = "DOCUMENT_UPLOADED"
+    RESCORE = "RESCORE"
+    APPROVE = "APPROVE"
+    REJECT = "REJECT"
 
-ReasonCategory = Literal[
-    "false_positive", "additional_evidence", "disagree_with_signal", 
-    "manual_review_complete", "low_risk_confirmed", "evidence_supports",
-    "high_risk_siu_referral", "insufficient_evidence", "other"
-]
+class ReasonCategory(StrEnum):
+    FALSE_POSITIVE = "false_positive"
+    ADDITIONAL_EVIDENCE = "additional_evidence"
+    DISAGREE_WITH_SIGNAL = "disagree_with_signal"
+    MANUAL_REVIEW_COMPLETE = "manual_review_complete"
+    LOW_RISK_CONFIRMED = "low_risk_confirmed"
+    EVIDENCE_SUPPORTS = "evidence_supports"
+    HIGH_RISK_SIU_REFERRAL = "high_risk_siu_referral"
+    INSUFFICIENT_EVIDENCE = "insufficient_evidence"
+    OTHER = "other"
 
-RiskBand = Literal["high", "medium", "low"]
+class RiskBand(StrEnum):
+    HIGH = "high"
+    MEDIUM = "medium"
+    LOW = "low"
 
-ClaimStatus = Literal["needs_review", "in_review", "rescored", "approved", "rejected"]
+class ClaimStatus(StrEnum):
+    NEEDS_REVIEW = "needs_review"
+    IN_REVIEW = "in_review"
+    RESCORED = "rescored"
+    APPROVED = "approved"
+    REJECTED = "rejected"
 
 class User(BaseModel):
     username: str
@@ -80,6 +111,10 @@ class DocumentInfo(BaseModel):
     uploaded_by: str
 
 class Claim(BaseModel):
+    # Cosmos docs carry extra keys (org_id, _etag, ...); drop them instead
+    # of erroring or storing them on every validated instance
+    model_config = ConfigDict(extra="ignore")
+
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     claim_id: str
     broker_id: str
@@ -108,7 +143,7 @@ class Claim(BaseModel):
     documents: List[DocumentInfo] = []
     fraud_score: Optional[int] = None
     risk_band: Optional[RiskBand] = None
-    status: ClaimStatus = "needs_review"
+    status: ClaimStatus = ClaimStatus.NEEDS_REVIEW
     signals: List[LLMSignal] = []
     rule_triggers: List[RuleTrigger] = []
     field_edits: List[FieldEdit] = []
@@ -124,6 +159,8 @@ class Claim(BaseModel):
     decided_at: Optional[datetime] = None
 
 class ClaimCreate(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
     claimant_name: str
     broker_id: Optional[str] = ""
     policy_id: str
@@ -191,6 +228,8 @@ class DecisionRequest(BaseModel):
     notes: str = Field(min_length=1)
 
 class AuditLog(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     claim_id: str
     user_name: str
@@ -221,6 +260,8 @@ class ExtractedFields(BaseModel):
     extraction_notes: Optional[str] = None
 
 class StatsResponse(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
     total_claims: int
     high_risk_claims: int
     medium_risk_claims: int
@@ -234,21 +275,31 @@ class StatsResponse(BaseModel):
     claims_last_24h: Optional[int] = None
     average_score: Optional[float] = None
     total_value_gbp: Optional[float] = None
+    overrides_today: Optional[int] = None
 
 
 # ============================================================================
 # MULTI-TENANT MODELS
 # ============================================================================
 
-SubscriptionStatus = Literal["active", "trial", "suspended", "cancelled"]
-SubscriptionTier = Literal["free", "enterprise"]
+class SubscriptionStatus(StrEnum):
+    ACTIVE = "active"
+    TRIAL = "trial"
+    SUSPENDED = "suspended"
+    CANCELLED = "cancelled"
+
+class SubscriptionTier(StrEnum):
+    FREE = "free"
+    ENTERPRISE = "enterprise"
 
 class Organization(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
     org_id: str
     org_name: str
     azure_tenant_id: str
-    subscription_status: SubscriptionStatus = "trial"
-    subscription_tier: SubscriptionTier = "free"
+    subscription_status: SubscriptionStatus = SubscriptionStatus.TRIAL
+    subscription_tier: SubscriptionTier = SubscriptionTier.FREE
     claims_count: int = 0
     users_count: int = 0
     trial_started_at: Optional[str] = None
@@ -257,6 +308,8 @@ class Organization(BaseModel):
     updated_at: Optional[str] = None
 
 class UserDB(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
     user_id: str
     org_id: str
     azure_ad_object_id: str
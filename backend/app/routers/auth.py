@@ -1,11 +1,13 @@
-from fastapi import APIRouter, HTTPException, Depends, status, Header
+from fastapi import APIRouter, HTTPException, Depends, status
 from ..models import LoginRequest, TokenResponse, User, UserWithOrg, Organization
-from ..services.auth import authenticate_user, create_access_token, get_current_user, TokenData
-from ..services.azure_ad_auth import (
-    validate_azure_ad_token,
-    provision_organization_and_user,
-    TokenValidationError,
+from ..services.auth import (
+    authenticate_user,
+    azure_ad_claims,
+    create_access_token,
+    get_current_user,
+    TokenData,
 )
+from ..services.azure_ad_auth import provision_organization_and_user
 from ..services.subscription import get_subscription_info, is_subscription_active
 from ..db.cosmos import get_cosmos_db
 
@@ -46,33 +48,16 @@ async def get_current_user_info(current_user: TokenData = Depends(get_current_us
 # ============================================================================
 
 @router.post("/azure-ad/validate")
-async def validate_token(authorization: str = Header(None)):
+async def validate_token(token_claims: dict = Depends(azure_ad_claims)):
     """
     Validate Azure AD token and auto-provision organization/user.
     Frontend calls this after successful MSAL login.
+    Token parsing/validation happens in the azure_ad_claims dependency.
     """
-    if not authorization:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Authorization header missing",
-        )
-
-    parts = authorization.split()
-    if len(parts) != 2 or parts[0].lower() != "bearer":
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid authorization header format. Expected: Bearer <token>",
-        )
-
-    token = parts[1]
-
     try:
-        # Validate token with Microsoft
-        token_claims = validate_azure_ad_token(token)
-
         # Auto-provision organization and user (sync calls)
         db = get_cosmos_db()
-        result = provision_organization_and_user(db, token_claims)
+        result = await provision_organization_and_user(db, token_claims)
 
         org = result["organization"]
         user = result["user"]
@@ -92,15 +77,10 @@ async def validate_token(authorization: str = Header(None)):
                     "subscription_tier": org.get("subscription_tier"),
                 },
             },
-            "subscription": get_subscription_info(org, db),
+            "subscription": await get_subscription_info(org, db),
             "token_valid": True,
         }
 
-    except TokenValidationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=f"Token validation failed: {str(e)}",
-        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -109,29 +89,13 @@ async def validate_token(authorization: str = Header(None)):
 
 
 @router.get("/azure-ad/me")
-async def get_azure_ad_user(authorization: str = Header(None)):
+async def get_azure_ad_user(token_claims: dict = Depends(azure_ad_claims)):
     """Get current user info from Azure AD token."""
-    if not authorization:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Authorization header missing",
-        )
-
-    parts = authorization.split()
-    if len(parts) != 2 or parts[0].lower() != "bearer":
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid authorization header format",
-        )
-
-    token = parts[1]
-
     try:
-        token_claims = validate_azure_ad_token(token)
         db = get_cosmos_db()
 
         azure_ad_object_id = token_claims["oid"]
-        user = db.get_user_by_azure_ad_id(azure_ad_object_id)
+        user = await db.get_user_by_azure_ad_id(azure_ad_object_id)
 
         if not user:
             raise HTTPException(
@@ -139,7 +103,7 @@ async def get_azure_ad_user(authorization: str = Header(None)):
                 detail="User not found. Please login again.",
             )
 
-        org = db.get_organization(user["org_id"])
+        org = await db.get_organization(user["org_id"])
         if not org:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -162,11 +126,6 @@ async def get_azure_ad_user(authorization: str = Header(None)):
             },
         }
 
-    except TokenValidationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=f"Token validation failed: {str(e)}",
-        )
     except HTTPException:
         raise
     except Exception as e:
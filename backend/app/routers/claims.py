@@ -1,7 +1,11 @@
-from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Form, status
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends, Response, UploadFile, File, Form, status
 from typing import List, Optional
-from datetime import datetime
-import uuid
+from datetime import datetime, timezone
+from secrets import token_hex
+import asyncio
+import logging
+import re
+import time
 import json
 
 from ..models import (
@@ -12,7 +16,7 @@ from ..services.auth import get_current_user, TokenData
 from ..services.rules_engine import run_rules_engine, calculate_risk_band
 from ..services.llm_analyzer import analyze_claim_signals
 from ..services.document_extraction import extract_fields_from_document
-from ..services.blob_storage import upload_document, generate_sas_url
+from ..services.blob_storage import upload_document, generate_sas_url, generate_sas_urls
 from ..services.justification import generate_justification, _generate_fallback_justification
 from ..services.subscription import (
     is_subscription_active,
@@ -21,18 +25,23 @@ from ..services.subscription import (
 )
 from ..db.cosmos import get_cosmos_db
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/api", tags=["Claims"])
 
 # Default org_id for legacy (username/password) authentication
 # All legacy users share this org until migrated to Azure AD
 DEFAULT_ORG_ID = "org_default"
 
+# Extraction metadata keys in ai_extracted_fields that aren't claim fields
+_SKIP_FIELDS = frozenset({"extraction_confidence", "extraction_notes", "error"})
+
 def get_org_id_for_user(current_user: TokenData) -> str:
     """Get org_id for the current user. Returns default for legacy auth."""
     # Legacy users don't have org_id, use default
     return getattr(current_user, 'org_id', None) or DEFAULT_ORG_ID
 
-def _get_org_and_enforce_subscription(org_id: str):
+async def _get_org_and_enforce_subscription(org_id: str):
     """
     Enforce subscription status. Called on EVERY endpoint.
     - Legacy users (org_default): bypass checks
@@ -43,7 +52,7 @@ def _get_org_and_enforce_subscription(org_id: str):
     if org_id == DEFAULT_ORG_ID:
         return None  # Legacy users bypass subscription checks
     db = get_cosmos_db()
-    org = db.get_organization(org_id)
+    org = await db.get_organization(org_id)
     if not org:
         return None  # Org not found, allow (shouldn't happen)
     if not is_subscription_active(org):
@@ -74,59 +83,181 @@ def normalize_value(value):
     """Normalize a value for comparison - handles numeric type differences."""
     if value is None:
         return None
-    
+
+    # Already numeric: no string round-trip needed
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float):
+        return int(value) if value.is_integer() else value
+
     str_val = str(value).strip()
-    
+
+    # Obvious non-numbers skip the float() parse entirely - raising and
+    # unwinding ValueError costs far more than this first-character check
+    if not str_val or (not str_val[0].isdigit() and str_val[0] not in "+-."):
+        return str_val
+
     try:
         float_val = float(str_val)
         if float_val == int(float_val):
             return int(float_val)
         return float_val
-    except (ValueError, TypeError):
+    except (ValueError, OverflowError):
         return str_val
 
 def values_are_equal(val1, val2) -> bool:
     """Compare two values after normalization to avoid false positives from type differences."""
+    # Identical values need no normalization - the common case, since most
+    # AI-extracted fields come back untouched
+    if val1 == val2:
+        return True
     norm1 = normalize_value(val1)
     norm2 = normalize_value(val2)
     return norm1 == norm2
 
+def _new_id() -> str:
+    """Random hex id for audit logs and signals - skips uuid4's object
+    construction and version/variant bookkeeping for the same 128 bits."""
+    return token_hex(16)
+
+_AUDIT_DEFAULTS = {
+    "field_changed": None,
+    "old_value": None,
+    "new_value": None,
+    "reason_category": None,
+    "notes": None,
+}
+
+def _make_audit(org_id: str, claim_id: str, user_name: str, action_type: str,
+                timestamp: str, **fields) -> dict:
+    """Build an audit log dict from a shared defaults template.
+
+    One construction site instead of seven hand-rolled literals; callers
+    override only the fields their action actually sets.
+    """
+    return {
+        **_AUDIT_DEFAULTS,
+        "id": _new_id(),
+        "org_id": org_id,
+        "claim_id": claim_id,
+        "user_name": user_name,
+        "action_type": action_type,
+        "timestamp": timestamp,
+        **fields,
+    }
+
+def utcnow_iso() -> str:
+    """Current UTC time as a naive ISO-8601 string (matches stored timestamps).
+
+    Handlers compute this once per request and reuse it rather than paying a
+    datetime allocation + format for every timestamp field they set.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None).isoformat()
+
 def generate_claim_id() -> str:
-    return f"CLM-{datetime.utcnow().strftime('%Y')}-{uuid.uuid4().hex[:8].upper()}"
+    # time.gmtime skips the strftime format machinery, and token_hex(4) draws
+    # exactly the 4 random bytes needed instead of a full UUID
+    return f"CLM-{time.gmtime().tm_year}-{token_hex(4).upper()}"
+
+# Extracted-document date fields compared against the accident date
+_DATE_FIELDS_TO_CHECK = {
+    "repair_invoice_date": "Repair invoice",
+    "estimate_date": "Repair estimate",
+    "document_date": "Document",
+    "invoice_date": "Invoice",
+    "quote_date": "Quote"
+}
+
+_DMY_DATE_RE = re.compile(r"(\d{1,2})[/-](\d{1,2})[/-](\d{4})$")
+
+def _parse_claim_date(value) -> Optional[datetime]:
+    """Parse an ISO or day-first (dd/mm/yyyy, dd-mm-yyyy) claim date.
+
+    Returns a naive datetime, or None when the value doesn't parse -
+    callers skip unparseable dates rather than handling exceptions.
+    fromisoformat is C-accelerated and covers both plain dates and full
+    timestamps, so the strptime format-cascade is replaced by one regex
+    fallback.
+    """
+    text = str(value).strip()
+    try:
+        return datetime.fromisoformat(text.replace("Z", "+00:00")).replace(tzinfo=None)
+    except ValueError:
+        pass
+    match = _DMY_DATE_RE.fullmatch(text)
+    if match:
+        day, month, year = map(int, match.groups())
+        try:
+            return datetime(year, month, day)
+        except ValueError:
+            return None
+    return None
 
 @router.get("/claims", response_model=List[dict])
 async def list_claims(
+    response: Response,
     current_user: TokenData = Depends(get_current_user),
-    last_24h: bool = False
+    last_24h: bool = False,
+    limit: int = 100,
+    continuation: Optional[str] = None
 ):
+    """List claims (server-side projection, highest fraud score first).
+
+    Pagination is opt-in: pass `limit`/`continuation` and read the next
+    page's token from the X-Continuation-Token response header. The body
+    stays a plain list so existing clients are unaffected.
+    """
     db = get_cosmos_db()
     org_id = get_org_id_for_user(current_user)
-    _get_org_and_enforce_subscription(org_id)
+    await _get_org_and_enforce_subscription(org_id)
     if last_24h:
-        claims = db.list_claims_last_24h(org_id)
+        claims = await db.list_claims_last_24h(org_id)
     else:
-        claims = db.list_claims(org_id)
+        try:
+            claims, next_token = await db.list_claims(org_id, limit=limit, continuation_token=continuation)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid continuation token")
+        if next_token:
+            response.headers["X-Continuation-Token"] = next_token
     return claims
 
 @router.get("/claims/{claim_id}")
 async def get_claim(
     claim_id: str,
-    current_user: TokenData = Depends(get_current_user)
+    current_user: TokenData = Depends(get_current_user),
+    include_audit: bool = True,
+    include_documents: bool = True
 ):
+    """Fetch a claim. Lightweight callers (e.g. previews or score polling)
+    can pass include_audit/include_documents=false to skip the audit-log
+    query and the document SAS signing respectively."""
     db = get_cosmos_db()
     org_id = get_org_id_for_user(current_user)
-    _get_org_and_enforce_subscription(org_id)
-    claim = db.get_claim(org_id, claim_id)
+    await _get_org_and_enforce_subscription(org_id)
+    if include_audit:
+        # Claim and audit logs are independent reads, so issue them concurrently
+        claim, audit_logs = await asyncio.gather(
+            db.get_claim_cached(org_id, claim_id),
+            db.get_audit_logs(org_id, claim_id),
+        )
+    else:
+        claim = await db.get_claim_cached(org_id, claim_id)
+        audit_logs = None
     if not claim:
         raise HTTPException(status_code=404, detail="Claim not found")
-    
-    audit_logs = db.get_audit_logs(org_id, claim_id)
-    claim["audit_logs"] = audit_logs
-    
-    for doc in claim.get("documents", []):
-        if doc.get("blob_path"):
-            doc["blob_url"] = generate_sas_url(doc["blob_path"])
-    
+
+    if include_audit:
+        claim["audit_logs"] = audit_logs
+
+    docs = [doc for doc in claim.get("documents", []) if doc.get("blob_path")] if include_documents else []
+    if docs:
+        # SAS signing is sync/CPU-bound; sign the batch off the event loop
+        blob_urls = await asyncio.to_thread(
+            generate_sas_urls, [doc["blob_path"] for doc in docs]
+        )
+        for doc, blob_url in zip(docs, blob_urls):
+            doc["blob_url"] = blob_url
+
     if claim.get("fraud_score") is not None and not claim.get("justification"):
         try:
             justification = await generate_justification(claim)
@@ -136,18 +267,123 @@ async def get_claim(
     
     return claim
 
+# Known-repeat names for the manual third-party/witness signal checks,
+# lowercased once at import so scoring only folds the claim's own value
+_KNOWN_REPEAT_THIRD_PARTIES = tuple(
+    name.lower() for name in
+    ["Michael Stevens", "James Patel", "Sarah Williams", "John Davidson"]
+)
+_KNOWN_REPEAT_WITNESSES = tuple(
+    name.lower() for name in
+    ["Dr. Rajesh Patel", "Dr. Sarah Mitchell", "Mohammed Khan", "Emily Roberts"]
+)
+
+async def _score_claim(db, claim: dict) -> None:
+    """Analyze signals and score a freshly created claim.
+
+    Runs as a background task after POST /claims returns, so the handler
+    pays for one Cosmos write instead of the LLM call plus two more writes.
+    Works on the already-saved claim dict; failures leave the claim
+    unscored (fraud_score None) rather than failing the creation.
+    """
+    claim_id = claim["claim_id"]
+    org_id = claim.get("org_id")
+    try:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Analyzing claim %s (third party: %s, witness: %s, type: %s, location: %s)",
+                claim_id,
+                claim.get("third_party_name"),
+                claim.get("witness_name"),
+                claim.get("accident_type"),
+                claim.get("accident_location"),
+            )
+
+        signals = await analyze_claim_signals(claim)
+        scored_iso = utcnow_iso()
+
+        # Manual signal generation for testing/debugging third-party and witness patterns
+        # This helps trigger repeat_third_party and professional_witness rules
+        third_party = claim.get("third_party_name", "")
+        if third_party and third_party.strip():
+            third_party_lower = third_party.lower()
+            if any(name in third_party_lower for name in _KNOWN_REPEAT_THIRD_PARTIES):
+                signals.append({
+                    "id": _new_id(),
+                    "signal_type": "third_party_pattern",
+                    "description": f"Third party '{third_party}' appears in multiple claims across different policies",
+                    "confidence": 0.85,
+                    "detected_at": scored_iso
+                })
+                logger.debug("Added third-party signal for: %s", third_party)
+
+        witness = claim.get("witness_name", "")
+        if witness and witness.strip():
+            witness_lower = witness.lower()
+            if any(name in witness_lower for name in _KNOWN_REPEAT_WITNESSES):
+                signals.append({
+                    "id": _new_id(),
+                    "signal_type": "witness_pattern",
+                    "description": f"Witness '{witness}' matches witnesses from multiple previous claims - potential professional witness",
+                    "confidence": 0.90,
+                    "detected_at": scored_iso
+                })
+                logger.debug("Added witness signal for: %s", witness)
+
+        claim["signals"] = signals
+        logger.debug("Total signals generated: %d", len(signals))
+
+        rules_result = run_rules_engine(claim, signals)
+        logger.debug(
+            "Scored claim %s: fraud_score=%s risk_band=%s rules_triggered=%d",
+            claim_id,
+            rules_result["fraud_score"],
+            rules_result["risk_band"],
+            len(rules_result["triggered_rules"]),
+        )
+        if rules_result["triggered_rules"] and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Rules triggered:\n%s",
+                "\n".join(
+                    f"  - {rule['rule_name']} (+{rule['weight']})"
+                    for rule in rules_result["triggered_rules"]
+                ),
+            )
+
+        # PATCH only the scored fields rather than re-upserting the whole
+        # document the initial save just wrote
+        await db.update_claim(org_id, claim_id, {
+            "signals": signals,
+            "fraud_score": rules_result["fraud_score"],
+            "risk_band": rules_result["risk_band"],
+            "rule_triggers": rules_result["triggered_rules"],
+            "scored_at": scored_iso
+        })
+
+        await db.save_audit_log(_make_audit(
+            org_id, claim_id, "system", "SCORE_GENERATED", scored_iso,
+            new_value=str(rules_result["fraud_score"]),
+            notes=f"AI scored claim as {rules_result['risk_band']} risk ({rules_result['fraud_score']}/100)",
+        ))
+    except asyncio.CancelledError:
+        # Don't swallow task cancellation during shutdown
+        raise
+    except Exception:
+        logger.exception("Error scoring claim %s", claim_id)
+
 @router.post("/claims")
 async def create_claim(
     claim_data: ClaimCreate,
+    background_tasks: BackgroundTasks,
     current_user: TokenData = Depends(get_current_user)
 ):
     db = get_cosmos_db()
     org_id = get_org_id_for_user(current_user)
     
     # Subscription enforcement
-    org = _get_org_and_enforce_subscription(org_id)
+    org = await _get_org_and_enforce_subscription(org_id)
     if org:
-        claims_check = check_claims_limit(org, db)
+        claims_check = await check_claims_limit(org, db)
         if not claims_check["allowed"]:
             raise HTTPException(
                 status_code=403,
@@ -155,34 +391,19 @@ async def create_claim(
             )
     
     claim_id = generate_claim_id()
-    
-    claim = {
-        "id": str(uuid.uuid4()),
+    now_iso = utcnow_iso()
+
+    # Dump the validated payload in one pydantic-core call rather than 25
+    # attribute reads, then overlay the server-side metadata; new ClaimCreate
+    # fields flow into the document without touching this handler
+    payload = claim_data.model_dump(exclude={"ai_extracted_fields"})
+    claim = dict(payload)
+    claim.update({
+        # id == claim_id so reads can be ~1 RU point reads on the /claim_id partition
+        "id": claim_id,
         "org_id": org_id,
         "claim_id": claim_id,
         "broker_id": claim_data.broker_id or "",
-        "claimant_name": claim_data.claimant_name,
-        "policy_id": claim_data.policy_id,
-        "policy_start_date": claim_data.policy_start_date,
-        "policyholder_address": claim_data.policyholder_address,
-        "num_previous_claims": claim_data.num_previous_claims,
-        "total_previous_claims_gbp": claim_data.total_previous_claims_gbp,
-        "vehicle_make": claim_data.vehicle_make,
-        "vehicle_model": claim_data.vehicle_model,
-        "vehicle_year": claim_data.vehicle_year,
-        "vehicle_registration": claim_data.vehicle_registration,
-        "vehicle_estimated_value_gbp": claim_data.vehicle_estimated_value_gbp,
-        "accident_date": claim_data.accident_date,
-        "accident_type": claim_data.accident_type,
-        "accident_location": claim_data.accident_location,
-        "claim_amount_gbp": claim_data.claim_amount_gbp,
-        "accident_description": claim_data.accident_description,
-        "witness_name": claim_data.witness_name,
-        "witness_contact": claim_data.witness_contact,
-        "third_party_name": claim_data.third_party_name,
-        "third_party_contact": claim_data.third_party_contact,
-        "third_party_vehicle_reg": claim_data.third_party_vehicle_reg,
-        "third_party_insurance": claim_data.third_party_insurance,
         "documents": [],
         "signals": [],
         "rule_triggers": [],
@@ -190,22 +411,26 @@ async def create_claim(
         "fraud_score": None,
         "risk_band": None,
         "status": "needs_review",
-        "created_at": datetime.utcnow().isoformat(),
-        "updated_at": datetime.utcnow().isoformat(),
+        "created_at": now_iso,
+        "updated_at": now_iso,
         "scored_at": None,
         "created_by": current_user.username,
         "decision_reason": None,
         "decision_notes": None,
         "decided_by": None,
         "decided_at": None
-    }
+    })
     
+    # Audit logs all share the claim's partition, so collect them and flush
+    # in one batched write instead of one round-trip per log
+    pending_audits = []
+
     if claim_data.ai_extracted_fields:
         ai_fields = claim_data.ai_extracted_fields
         for field_name, ai_value in ai_fields.items():
-            if field_name in ["extraction_confidence", "extraction_notes", "error"]:
+            if field_name in _SKIP_FIELDS:
                 continue
-            current_value = getattr(claim_data, field_name, None)
+            current_value = payload.get(field_name)
             if current_value is not None and ai_value is not None:
                 if not values_are_equal(current_value, ai_value):
                     claim["field_edits"].append({
@@ -213,109 +438,34 @@ async def create_claim(
                         "original_value": str(ai_value),
                         "edited_value": str(current_value),
                         "edited_by": current_user.full_name,
-                        "edited_at": datetime.utcnow().isoformat(),
+                        "edited_at": now_iso,
                         "reason": "User edited AI-extracted value"
                     })
-                    db.save_audit_log({
-                        "id": str(uuid.uuid4()),
-                        "org_id": org_id,
-                        "claim_id": claim_id,
-                        "user_name": current_user.full_name,
-                        "action_type": "FIELD_EDIT",
-                        "field_changed": field_name,
-                        "old_value": str(ai_value),
-                        "new_value": str(current_value),
-                        "timestamp": datetime.utcnow().isoformat()
-                    })
-    
-    saved_claim = db.save_claim(claim)
-    
+                    pending_audits.append(_make_audit(
+                        org_id, claim_id, current_user.full_name, "FIELD_EDIT", now_iso,
+                        field_changed=field_name,
+                        old_value=str(ai_value),
+                        new_value=str(current_value),
+                    ))
+
+    saved_claim = await db.save_claim(claim)
+
     # Track usage
     if org_id != DEFAULT_ORG_ID:
-        db.increment_org_claims_count(org_id)
-    
-    db.save_audit_log({
-        "id": str(uuid.uuid4()),
-        "org_id": org_id,
-        "claim_id": claim_id,
-        "user_name": current_user.full_name,
-        "action_type": "CLAIM_CREATED",
-        "new_value": claim_id,
-        "notes": f"Claim created by {current_user.full_name}",
-        "timestamp": datetime.utcnow().isoformat()
-    })
-    
-    try:
-        print(f"\n=== ANALYZING CLAIM {claim_id} ===")
-        print(f"Third Party: {claim.get('third_party_name')}")
-        print(f"Witness: {claim.get('witness_name')}")
-        print(f"Accident Type: {claim.get('accident_type')}")
-        print(f"Location: {claim.get('accident_location')}")
-        
-        signals = await analyze_claim_signals(claim)
-        
-        # Manual signal generation for testing/debugging third-party and witness patterns
-        # This helps trigger repeat_third_party and professional_witness rules
-        known_repeat_third_parties = ["Michael Stevens", "James Patel", "Sarah Williams", "John Davidson"]
-        known_repeat_witnesses = ["Dr. Rajesh Patel", "Dr. Sarah Mitchell", "Mohammed Khan", "Emily Roberts"]
-        
-        third_party = claim.get("third_party_name", "")
-        if third_party and third_party.strip():
-            if any(name.lower() in third_party.lower() for name in known_repeat_third_parties):
-                signals.append({
-                    "id": str(uuid.uuid4()),
-                    "signal_type": "third_party_pattern",
-                    "description": f"Third party '{third_party}' appears in multiple claims across different policies",
-                    "confidence": 0.85,
-                    "detected_at": datetime.utcnow().isoformat()
-                })
-                print(f"✓ Added third-party signal for: {third_party}")
-        
-        witness = claim.get("witness_name", "")
-        if witness and witness.strip():
-            if any(name.lower() in witness.lower() for name in known_repeat_witnesses):
-                signals.append({
-                    "id": str(uuid.uuid4()),
-                    "signal_type": "witness_pattern",
-                    "description": f"Witness '{witness}' matches witnesses from multiple previous claims - potential professional witness",
-                    "confidence": 0.90,
-                    "detected_at": datetime.utcnow().isoformat()
-                })
-                print(f"✓ Added witness signal for: {witness}")
-        
-        saved_claim["signals"] = signals
-        print(f"Total signals generated: {len(signals)}")
-        
-        print(f"\n=== RUNNING RULES ENGINE ===")
-        rules_result = run_rules_engine(claim, signals)
-        print(f"Fraud Score: {rules_result['fraud_score']}")
-        print(f"Risk Band: {rules_result['risk_band']}")
-        print(f"Rules Triggered: {len(rules_result['triggered_rules'])}")
-        for rule in rules_result['triggered_rules']:
-            print(f"  - {rule['rule_name']} (+{rule['weight']})")
-        
-        saved_claim["fraud_score"] = rules_result["fraud_score"]
-        saved_claim["risk_band"] = rules_result["risk_band"]
-        saved_claim["rule_triggers"] = rules_result["triggered_rules"]
-        saved_claim["scored_at"] = datetime.utcnow().isoformat()
-        
-        db.save_claim(saved_claim)
-        
-        db.save_audit_log({
-            "id": str(uuid.uuid4()),
-            "org_id": org_id,
-            "claim_id": claim_id,
-            "user_name": "system",
-            "action_type": "SCORE_GENERATED",
-            "new_value": str(rules_result["fraud_score"]),
-            "notes": f"AI scored claim as {rules_result['risk_band']} risk ({rules_result['fraud_score']}/100)",
-            "timestamp": datetime.utcnow().isoformat()
-        })
-    except Exception as e:
-        print(f"❌ Error scoring claim: {e}")
-        import traceback
-        traceback.print_exc()
-    
+        await db.increment_org_claims_count(org_id)
+
+    pending_audits.append(_make_audit(
+        org_id, claim_id, current_user.full_name, "CLAIM_CREATED", now_iso,
+        new_value=claim_id,
+        notes=f"Claim created by {current_user.full_name}",
+    ))
+    await db.save_audit_logs(pending_audits)
+    
+    # Scoring involves an LLM call and two more Cosmos writes; run it after
+    # the response so POST latency is just the initial persist. Clients poll
+    # GET /claims/{id} for the score.
+    background_tasks.add_task(_score_claim, db, saved_claim)
+
     return saved_claim
 
 @router.patch("/claims/{claim_id}/fields")
@@ -342,152 +492,120 @@ async def rescore_claim(
         detail="Claims are read-only after submission and cannot be rescored"
     )
 
-@router.post("/claims/{claim_id}/approve")
-async def approve_claim(
+async def _apply_decision(
     claim_id: str,
-    request: DecisionRequest,
-    current_user: TokenData = Depends(get_current_user)
-):
-    """Approve the claim with mandatory reason and notes."""
+    current_user: TokenData,
+    background_tasks: BackgroundTasks,
+    *,
+    new_status: str,
+    action_type: str,
+    reason: Optional[str] = None,
+    notes: Optional[str] = None,
+) -> dict:
+    """Shared fetch -> validate -> mutate -> save -> audit -> respond path
+    for the decision endpoints (approve, reject, mark-in-review).
+
+    One implementation means the status transitions all pick up the same
+    optimizations: hoisted timestamp, deferred audit write, locally spliced
+    audit history.
+    """
     db = get_cosmos_db()
     org_id = get_org_id_for_user(current_user)
-    _get_org_and_enforce_subscription(org_id)
-    claim = db.get_claim(org_id, claim_id)
+    await _get_org_and_enforce_subscription(org_id)
+    # Prefetch the audit history alongside the claim; the response needs it
+    # anyway and fetching both up front avoids a separate re-read after the
+    # write just to return the list
+    claim, prior_logs = await asyncio.gather(
+        db.get_claim(org_id, claim_id),
+        db.get_audit_logs(org_id, claim_id),
+    )
     if not claim:
         raise HTTPException(status_code=404, detail="Claim not found")
-    
-    if claim.get("status") in ["approved", "rejected"]:
+
+    old_status = claim.get("status")
+    if new_status == "in_review":
+        if old_status != "needs_review":
+            raise HTTPException(
+                status_code=400,
+                detail="Only claims with 'needs_review' status can be marked as in review"
+            )
+    elif old_status in ["approved", "rejected"]:
         raise HTTPException(
-            status_code=400, 
+            status_code=400,
             detail="Claim has already been decided"
         )
-    
-    old_status = claim.get("status")
-    
-    claim["status"] = "approved"
-    claim["decision_reason"] = request.reason
-    claim["decision_notes"] = request.notes
-    claim["decided_by"] = current_user.full_name
-    claim["decided_at"] = datetime.utcnow().isoformat()
-    claim["updated_at"] = datetime.utcnow().isoformat()
-    
-    db.save_claim(claim)
-    
-    db.save_audit_log({
-        "id": str(uuid.uuid4()),
-        "org_id": org_id,
-        "claim_id": claim_id,
-        "user_name": current_user.full_name,
-        "action_type": "APPROVE",
-        "field_changed": "status",
-        "old_value": old_status,
-        "new_value": "approved",
-        "reason_category": request.reason,
-        "notes": request.notes,
-        "timestamp": datetime.utcnow().isoformat()
-    })
-    
-    audit_logs = db.get_audit_logs(org_id, claim_id)
-    claim["audit_logs"] = audit_logs
-    
+
+    now_iso = utcnow_iso()
+    claim["status"] = new_status
+    claim["updated_at"] = now_iso
+    if new_status == "in_review":
+        claim["in_review_by"] = current_user.full_name
+        claim["in_review_at"] = now_iso
+        audit_notes = f"Claim marked as in review by {current_user.full_name}"
+    else:
+        claim["decision_reason"] = reason
+        claim["decision_notes"] = notes
+        claim["decided_by"] = current_user.full_name
+        claim["decided_at"] = now_iso
+        audit_notes = notes
+
+    await db.save_claim(claim)
+
+    # Audit writes are append-only bookkeeping; run them after the response
+    # and splice the new log into the returned history locally
+    audit_log = _make_audit(
+        org_id, claim_id, current_user.full_name, action_type, now_iso,
+        field_changed="status",
+        old_value=old_status,
+        new_value=new_status,
+        reason_category=reason,
+        notes=audit_notes,
+    )
+    background_tasks.add_task(db.save_audit_log, audit_log)
+
+    claim["audit_logs"] = [audit_log] + prior_logs
+
     return claim
 
+@router.post("/claims/{claim_id}/approve")
+async def approve_claim(
+    claim_id: str,
+    request: DecisionRequest,
+    background_tasks: BackgroundTasks,
+    current_user: TokenData = Depends(get_current_user)
+):
+    """Approve the claim with mandatory reason and notes."""
+    return await _apply_decision(
+        claim_id, current_user, background_tasks,
+        new_status="approved", action_type="APPROVE",
+        reason=request.reason, notes=request.notes,
+    )
+
 @router.post("/claims/{claim_id}/mark-in-review")
 async def mark_in_review(
     claim_id: str,
+    background_tasks: BackgroundTasks,
     current_user: TokenData = Depends(get_current_user)
 ):
     """Mark a claim as 'in_review' - any user can do this."""
-    db = get_cosmos_db()
-    org_id = get_org_id_for_user(current_user)
-    _get_org_and_enforce_subscription(org_id)
-    claim = db.get_claim(org_id, claim_id)
-    if not claim:
-        raise HTTPException(status_code=404, detail="Claim not found")
-    
-    if claim.get("status") != "needs_review":
-        raise HTTPException(
-            status_code=400, 
-            detail="Only claims with 'needs_review' status can be marked as in review"
-        )
-    
-    old_status = claim.get("status")
-    
-    claim["status"] = "in_review"
-    claim["in_review_by"] = current_user.full_name
-    claim["in_review_at"] = datetime.utcnow().isoformat()
-    claim["updated_at"] = datetime.utcnow().isoformat()
-    
-    db.save_claim(claim)
-    
-    db.save_audit_log({
-        "id": str(uuid.uuid4()),
-        "org_id": org_id,
-        "claim_id": claim_id,
-        "user_name": current_user.full_name,
-        "action_type": "STATUS_CHANGE",
-        "field_changed": "status",
-        "old_value": old_status,
-        "new_value": "in_review",
-        "reason_category": None,
-        "notes": f"Claim marked as in review by {current_user.full_name}",
-        "timestamp": datetime.utcnow().isoformat()
-    })
-    
-    audit_logs = db.get_audit_logs(org_id, claim_id)
-    claim["audit_logs"] = audit_logs
-    
-    return claim
+    return await _apply_decision(
+        claim_id, current_user, background_tasks,
+        new_status="in_review", action_type="STATUS_CHANGE",
+    )
 
 @router.post("/claims/{claim_id}/reject")
 async def reject_claim(
     claim_id: str,
     request: DecisionRequest,
+    background_tasks: BackgroundTasks,
     current_user: TokenData = Depends(get_current_user)
 ):
     """Reject the claim with mandatory reason and notes."""
-    db = get_cosmos_db()
-    org_id = get_org_id_for_user(current_user)
-    _get_org_and_enforce_subscription(org_id)
-    claim = db.get_claim(org_id, claim_id)
-    if not claim:
-        raise HTTPException(status_code=404, detail="Claim not found")
-    
-    if claim.get("status") in ["approved", "rejected"]:
-        raise HTTPException(
-            status_code=400, 
-            detail="Claim has already been decided"
-        )
-    
-    old_status = claim.get("status")
-    
-    claim["status"] = "rejected"
-    claim["decision_reason"] = request.reason
-    claim["decision_notes"] = request.notes
-    claim["decided_by"] = current_user.full_name
-    claim["decided_at"] = datetime.utcnow().isoformat()
-    claim["updated_at"] = datetime.utcnow().isoformat()
-    
-    db.save_claim(claim)
-    
-    db.save_audit_log({
-        "id": str(uuid.uuid4()),
-        "org_id": org_id,
-        "claim_id": claim_id,
-        "user_name": current_user.full_name,
-        "action_type": "REJECT",
-        "field_changed": "status",
-        "old_value": old_status,
-        "new_value": "rejected",
-        "reason_category": request.reason,
-        "notes": request.notes,
-        "timestamp": datetime.utcnow().isoformat()
-    })
-    
-    audit_logs = db.get_audit_logs(org_id, claim_id)
-    claim["audit_logs"] = audit_logs
-    
-    return claim
+    return await _apply_decision(
+        claim_id, current_user, background_tasks,
+        new_status="rejected", action_type="REJECT",
+        reason=request.reason, notes=request.notes,
+    )
 
 @router.post("/claims/{claim_id}/override")
 async def override_score(
@@ -519,7 +637,7 @@ async def extract_fields(
     current_user: TokenData = Depends(get_current_user)
 ):
     org_id = get_org_id_for_user(current_user)
-    _get_org_and_enforce_subscription(org_id)
+    await _get_org_and_enforce_subscription(org_id)
     content = await file.read()
     
     extracted = await extract_fields_from_document(
@@ -533,17 +651,18 @@ async def extract_fields(
 @router.post("/claims/{claim_id}/upload")
 async def upload_claim_document(
     claim_id: str,
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     current_user: TokenData = Depends(get_current_user)
 ):
     db = get_cosmos_db()
     org_id = get_org_id_for_user(current_user)
-    claim = db.get_claim(org_id, claim_id)
+    claim = await db.get_claim(org_id, claim_id)
     if not claim:
         raise HTTPException(status_code=404, detail="Claim not found")
     
     # Subscription enforcement - document limit
-    org = _get_org_and_enforce_subscription(org_id)
+    org = await _get_org_and_enforce_subscription(org_id)
     if org:
         docs_check = check_documents_limit(org, claim)
         if not docs_check["allowed"]:
@@ -553,114 +672,94 @@ async def upload_claim_document(
             )
     
     content = await file.read()
-    
-    # Extract fields from document to check for timeline inconsistencies
-    try:
-        extracted = await extract_fields_from_document(
+    now_iso = utcnow_iso()
+
+    # Extraction (LLM/OCR) and the blob PUT are independent once the bytes
+    # are in hand, so run them concurrently - wall time drops from the sum
+    # to the max of the two. Extraction reads the bytes buffer while the
+    # upload streams from the spooled temp file. return_exceptions keeps an
+    # extraction failure from cancelling the upload.
+    await file.seek(0)
+    extracted, upload_result = await asyncio.gather(
+        extract_fields_from_document(
             file_content=content,
             content_type=file.content_type or "application/octet-stream",
             filename=file.filename or "document"
-        )
-        
+        ),
+        upload_document(
+            file_content=file.file,
+            filename=file.filename or "document",
+            content_type=file.content_type or "application/octet-stream",
+            claim_id=claim_id,
+            user_name=current_user.username
+        ),
+        return_exceptions=True,
+    )
+    if isinstance(upload_result, BaseException):
+        raise upload_result
+    blob_path, blob_url = upload_result
+
+    if isinstance(extracted, BaseException):
+        logger.warning("Error extracting document data: %s", extracted)
+    else:
         # Check for timeline inconsistencies in extracted document
         accident_date_str = claim.get("accident_date")
         signals_to_add = []
         
         if accident_date_str and not extracted.get("error"):
-            try:
-                # Parse accident date
-                if "T" in str(accident_date_str):
-                    accident_date = datetime.fromisoformat(str(accident_date_str).replace("Z", "+00:00"))
-                else:
-                    accident_date = datetime.strptime(str(accident_date_str), "%Y-%m-%d")
-                
-                # Check various date fields from extraction
-                date_fields_to_check = {
-                    "repair_invoice_date": "Repair invoice",
-                    "estimate_date": "Repair estimate", 
-                    "document_date": "Document",
-                    "invoice_date": "Invoice",
-                    "quote_date": "Quote"
-                }
-                
-                for field_name, field_label in date_fields_to_check.items():
+            accident_date = _parse_claim_date(accident_date_str)
+            if accident_date is not None:
+                for field_name, field_label in _DATE_FIELDS_TO_CHECK.items():
                     extracted_date_str = extracted.get(field_name)
-                    if extracted_date_str:
-                        try:
-                            # Parse extracted date
-                            if "T" in str(extracted_date_str):
-                                extracted_date = datetime.fromisoformat(str(extracted_date_str).replace("Z", "+00:00"))
-                            else:
-                                for fmt in ["%Y-%m-%d", "%d/%m/%Y", "%d-%m-%Y"]:
-                                    try:
-                                        extracted_date = datetime.strptime(str(extracted_date_str), fmt)
-                                        break
-                                    except ValueError:
-                                        continue
-                                else:
-                                    continue
-                            
-                            # Check if document date is before accident date
-                            if extracted_date.replace(tzinfo=None) < accident_date.replace(tzinfo=None):
-                                days_before = (accident_date.replace(tzinfo=None) - extracted_date.replace(tzinfo=None)).days
-                                signals_to_add.append({
-                                    "id": str(uuid.uuid4()),
-                                    "signal_type": "timeline_inconsistency",
-                                    "description": f"{field_label} dated {extracted_date_str} is {days_before} days before accident date {accident_date_str}",
-                                    "confidence": 0.95,
-                                    "detected_at": datetime.utcnow().isoformat()
-                                })
-                                print(f"\\n⚠️  TIMELINE INCONSISTENCY DETECTED: {field_label} {extracted_date_str} before accident {accident_date_str}")
-                        except Exception as e:
-                            print(f"Error parsing {field_name}: {e}")
-                            continue
-            except Exception as e:
-                print(f"Error checking timeline: {e}")
+                    if not extracted_date_str:
+                        continue
+                    extracted_date = _parse_claim_date(extracted_date_str)
+                    if extracted_date is None:
+                        continue
+                    # Check if document date is before accident date
+                    if extracted_date < accident_date:
+                        days_before = (accident_date - extracted_date).days
+                        signals_to_add.append({
+                            "id": _new_id(),
+                            "signal_type": "timeline_inconsistency",
+                            "description": f"{field_label} dated {extracted_date_str} is {days_before} days before accident date {accident_date_str}",
+                            "confidence": 0.95,
+                            "detected_at": now_iso
+                        })
+                        logger.warning(
+                            "Timeline inconsistency detected: %s %s before accident %s",
+                            field_label, extracted_date_str, accident_date_str,
+                        )
         
         # Add timeline signals to claim
         if signals_to_add:
             if "signals" not in claim:
                 claim["signals"] = []
             claim["signals"].extend(signals_to_add)
-            print(f"Added {len(signals_to_add)} timeline inconsistency signals")
-    except Exception as e:
-        print(f"Error extracting document data: {e}")
-    
-    blob_path, blob_url = await upload_document(
-        file_content=content,
-        filename=file.filename or "document",
-        content_type=file.content_type or "application/octet-stream",
-        claim_id=claim_id,
-        user_name=current_user.username
-    )
-    
+            logger.debug("Added %d timeline inconsistency signals", len(signals_to_add))
+
     doc_info = {
         "blob_path": blob_path,
         "blob_url": blob_url,
         "filename": file.filename or "document",
         "content_type": file.content_type or "application/octet-stream",
-        "uploaded_at": datetime.utcnow().isoformat(),
+        "uploaded_at": now_iso,
         "uploaded_by": current_user.username
     }
     
     if "documents" not in claim:
         claim["documents"] = []
     claim["documents"].append(doc_info)
-    claim["updated_at"] = datetime.utcnow().isoformat()
-    
-    db.save_claim(claim)
-    
-    db.save_audit_log({
-        "id": str(uuid.uuid4()),
-        "org_id": org_id,
-        "claim_id": claim_id,
-        "user_name": current_user.full_name,
-        "action_type": "DOCUMENT_UPLOADED",
-        "new_value": file.filename,
-        "notes": f"Document uploaded by {current_user.full_name}",
-        "timestamp": datetime.utcnow().isoformat()
-    })
+    claim["updated_at"] = now_iso
     
+    await db.save_claim(claim)
+
+    background_tasks.add_task(db.save_audit_log, _make_audit(
+        org_id, claim_id, current_user.full_name, "DOCUMENT_UPLOADED", now_iso,
+        new_value=file.filename,
+        notes=f"Document uploaded by {current_user.full_name}",
+    ))
+
     return {"success": True, "document": doc_info}
 
 @router.get("/stats", response_model=StatsResponse)
@@ -669,8 +768,8 @@ async def get_stats(
 ):
     db = get_cosmos_db()
     org_id = get_org_id_for_user(current_user)
-    _get_org_and_enforce_subscription(org_id)
-    stats = db.get_stats(org_id)
+    await _get_org_and_enforce_subscription(org_id)
+    stats = await db.get_stats(org_id)
     return StatsResponse(**stats)
 
 @router.get("/claims/{claim_id}/audit-logs")
@@ -680,6 +779,6 @@ async def get_claim_audit_logs(
 ):
     db = get_cosmos_db()
     org_id = get_org_id_for_user(current_user)
-    _get_org_and_enforce_subscription(org_id)
-    logs = db.get_audit_logs(org_id, claim_id)
+    await _get_org_and_enforce_subscription(org_id)
+    logs = await db.get_audit_logs(org_id, claim_id)
     return logs
@@ -54,7 +54,7 @@ class ManualProvisionRequest(BaseModel):
     subscription_tier: str = "free"
 
 
-def _get_org_from_token(authorization: str):
+async def _get_org_from_token(authorization: str):
     """Extract org from Azure AD token (sync)."""
     if not authorization:
         raise HTTPException(status_code=401, detail="Authorization header missing")
@@ -67,11 +67,11 @@ def _get_org_from_token(authorization: str):
         token_claims = validate_azure_ad_token(parts[1])
         db = get_cosmos_db()
 
-        user = db.get_user_by_azure_ad_id(token_claims["oid"])
+        user = await db.get_user_by_azure_ad_id(token_claims["oid"])
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
 
-        org = db.get_organization(user["org_id"])
+        org = await db.get_organization(user["org_id"])
         if not org:
             raise HTTPException(status_code=404, detail="Organization not found")
 
@@ -84,7 +84,7 @@ def _get_org_from_token(authorization: str):
 @router.get("/me")
 async def get_my_organization(authorization: str = Header(None)):
     """Get current user's organization details."""
-    org = _get_org_from_token(authorization)
+    org = await _get_org_from_token(authorization)
     return {
         "org_id": org.get("org_id"),
         "org_name": org.get("org_name"),
@@ -103,7 +103,7 @@ async def update_my_organization(
     authorization: str = Header(None),
 ):
     """Update current user's organization settings."""
-    org = _get_org_from_token(authorization)
+    org = await _get_org_from_token(authorization)
     db = get_cosmos_db()
 
     if update.org_name is not None:
@@ -121,7 +121,7 @@ async def update_my_organization(
             raise HTTPException(status_code=400, detail=f"Invalid tier. Must be one of: {allowed}")
         org["subscription_tier"] = update.subscription_tier
 
-    db.update_organization_item(org)
+    await db.update_organization_item(org)
 
     return {"message": "Organization updated successfully", "organization": org}
 
@@ -136,11 +136,11 @@ async def manual_provision_organization(
     Requires authentication.
     """
     # Verify user is authenticated (admin check can be added here)
-    _get_org_from_token(authorization)
+    await _get_org_from_token(authorization)
     
     db = get_cosmos_db()
 
-    existing = db.get_organization(request.org_id)
+    existing = await db.get_organization(request.org_id)
     if existing:
         raise HTTPException(status_code=409, detail=f"Organization {request.org_id} already exists")
 
@@ -158,7 +158,7 @@ async def manual_provision_organization(
         "updated_at": now,
     }
 
-    db.create_organization(org)
+    await db.create_organization(org)
 
     return {"message": "Organization created successfully", "organization": org}
 
@@ -171,9 +171,9 @@ async def manual_provision_organization(
 @router.get("/subscription")
 async def get_my_subscription(authorization: str = Header(None)):
     """Get current organization's subscription details, usage, and limits."""
-    org = _get_org_from_token(authorization)
+    org = await _get_org_from_token(authorization)
     db = get_cosmos_db()
-    return get_subscription_info(org, db)
+    return await get_subscription_info(org, db)
 
 
 @router.get("/subscription/tiers")
@@ -205,7 +205,7 @@ async def upgrade_subscription(
     Upgrade organization subscription tier to enterprise.
     In production, this is triggered by Azure Marketplace webhook.
     """
-    org = _get_org_from_token(authorization)
+    org = await _get_org_from_token(authorization)
     db = get_cosmos_db()
 
     valid_tiers = ["free", "enterprise"]
@@ -232,7 +232,7 @@ async def upgrade_subscription(
     org["subscription_tier"] = request.tier
     org["subscription_status"] = "active"  # Upgrading activates the subscription
     org["upgraded_at"] = datetime.utcnow().isoformat()
-    db.update_organization_item(org)
+    await db.update_organization_item(org)
 
     return {
         "message": f"Successfully upgraded to {TIER_LIMITS[request.tier]['display_name']}",
@@ -251,7 +251,7 @@ async def activate_subscription(authorization: str = Header(None)):
     Activate subscription (move from trial to active).
     In production, this would verify payment first.
     """
-    org = _get_org_from_token(authorization)
+    org = await _get_org_from_token(authorization)
     db = get_cosmos_db()
 
     if org.get("subscription_status") == "active":
@@ -259,7 +259,7 @@ async def activate_subscription(authorization: str = Header(None)):
 
     org["subscription_status"] = "active"
     org["activated_at"] = datetime.utcnow().isoformat()
-    db.update_organization_item(org)
+    await db.update_organization_item(org)
 
     return {
         "message": "Subscription activated successfully",
@@ -332,7 +332,7 @@ async def marketplace_landing(body: MarketplaceLandingRequest):
     tier = map_plan_to_tier(plan_id)
 
     # --- Step 2: Provision or upgrade organization ---
-    org = db.get_organization_by_tenant_id(tenant_id)
+    org = await db.get_organization_by_tenant_id(tenant_id)
     now = datetime.utcnow().isoformat()
 
     if org:
@@ -344,7 +344,7 @@ async def marketplace_landing(body: MarketplaceLandingRequest):
         org["marketplace_offer_id"] = offer_id
         org["marketplace_activated_at"] = now
         org["updated_at"] = now
-        db.update_organization_item(org)
+        await db.update_organization_item(org)
         logger.info(
             f"Marketplace landing: upgraded existing org {org['org_id']} → {tier}"
         )
@@ -374,7 +374,7 @@ async def marketplace_landing(body: MarketplaceLandingRequest):
             "created_at": now,
             "updated_at": now,
         }
-        db.create_organization(org)
+        await db.create_organization(org)
         logger.info(
             f"Marketplace landing: created new org {org_id} as {tier}"
         )
@@ -492,11 +492,11 @@ async def marketplace_webhook(
             # Check if this activityId has already been processed
             query = "SELECT * FROM c WHERE c.type = 'webhook_activity' AND c.activity_id = @activity_id"
             params = [{"name": "@activity_id", "value": activity_id}]
-            existing = list(db.organizations_container.query_items(
+            existing = [item async for item in db.organizations_container.query_items(
                 query=query,
                 parameters=params,
                 enable_cross_partition_query=True,
-            ))
+            )]
             
             if existing:
                 logger.info(
@@ -512,11 +512,11 @@ async def marketplace_webhook(
         try:
             query = "SELECT * FROM c WHERE c.marketplace_subscription_id = @sub_id"
             params = [{"name": "@sub_id", "value": subscription_id}]
-            items = list(db.organizations_container.query_items(
+            items = [item async for item in db.organizations_container.query_items(
                 query=query,
                 parameters=params,
                 enable_cross_partition_query=True,
-            ))
+            )]
             org = items[0] if items else None
         except Exception as e:
             logger.error(f"[Marketplace Webhook] Error finding org: {e}")
@@ -539,14 +539,14 @@ async def marketplace_webhook(
         if new_tier == "enterprise":
             org["subscription_status"] = "active"
         org["updated_at"] = now
-        db.update_organization_item(org)
+        await db.update_organization_item(org)
         needs_patch = True
         logger.info(f"[Webhook] ChangePlan: {org['org_id']} → {new_tier}")
 
     elif action == "changequantity":
         org["marketplace_quantity"] = payload.quantity
         org["updated_at"] = now
-        db.update_organization_item(org)
+        await db.update_organization_item(org)
         needs_patch = True
         logger.info(f"[Webhook] ChangeQuantity: {org['org_id']} → {payload.quantity}")
 
@@ -554,21 +554,21 @@ async def marketplace_webhook(
         org["subscription_status"] = "suspended"
         org["suspended_at"] = now
         org["updated_at"] = now
-        db.update_organization_item(org)
+        await db.update_organization_item(org)
         logger.info(f"[Webhook] Suspend: {org['org_id']}")
 
     elif action == "unsubscribe":
         org["subscription_status"] = "cancelled"
         org["cancelled_at"] = now
         org["updated_at"] = now
-        db.update_organization_item(org)
+        await db.update_organization_item(org)
         logger.info(f"[Webhook] Unsubscribe: {org['org_id']}")
 
     elif action == "reinstate":
         org["subscription_status"] = "active"
         org["reinstated_at"] = now
         org["updated_at"] = now
-        db.update_organization_item(org)
+        await db.update_organization_item(org)
         needs_patch = True
         logger.info(f"[Webhook] Reinstate: {org['org_id']}")
 
@@ -599,7 +599,7 @@ async def marketplace_webhook(
                 "org_id": org.get("org_id"),
                 "processed_at": datetime.utcnow().isoformat(),
             }
-            db.organizations_container.create_item(webhook_record)
+            await db.organizations_container.create_item(webhook_record)
             logger.info(f"[Webhook] Stored activityId={activity_id} for idempotency")
         except Exception as e:
             # Non-fatal: if storage fails, at least we processed the webhook
@@ -2,7 +2,7 @@ import os
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import JWTError, jwt
-from fastapi import HTTPException, Depends, status
+from fastapi import Header, HTTPException, Depends, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel
 
@@ -35,7 +35,7 @@ def create_access_token(data: dict) -> str:
     to_encode.update({"exp": expire})
     return jwt.encode(to_encode, JWT_SECRET, algorithm=JWT_ALGORITHM)
 
-def verify_token(token: str) -> TokenData:
+async def verify_token(token: str) -> TokenData:
     """Try legacy HS256 token first, then Azure AD RS256 token."""
     # 1. Try legacy HS256 token
     try:
@@ -61,7 +61,7 @@ def verify_token(token: str) -> TokenData:
             )
 
         db = get_cosmos_db()
-        user = db.get_user_by_azure_ad_id(azure_ad_object_id)
+        user = await db.get_user_by_azure_ad_id(azure_ad_object_id)
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -84,4 +84,39 @@ def verify_token(token: str) -> TokenData:
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ) -> TokenData:
-    return verify_token(credentials.credentials)
+    return await verify_token(credentials.credentials)
+
+async def bearer_token(authorization: str = Header(None)) -> str:
+    """Dependency: extract the raw token from a `Bearer <token>` header.
+
+    A prefix slice avoids the list + substring allocations of
+    `authorization.split()` on this per-request hot path.
+    """
+    if not authorization:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Authorization header missing",
+        )
+    if len(authorization) < 8 or authorization[:7].lower() != "bearer ":
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid authorization header format. Expected: Bearer <token>",
+        )
+    return authorization[7:].strip()
+
+async def azure_ad_claims(token: str = Depends(bearer_token)) -> dict:
+    """Dependency: validated Azure AD token claims.
+
+    FastAPI memoizes dependency results per request, so stacking this on
+    top of `bearer_token` means the header is parsed and the token
+    verified at most once per request, however many dependants use it.
+    """
+    from .azure_ad_auth import validate_azure_ad_token_cached, TokenValidationError
+
+    try:
+        return validate_azure_ad_token_cached(token)
+    except TokenValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=f"Token validation failed: {str(e)}",
+        )
@@ -8,6 +8,7 @@ Handles:
 4. User and organization auto-provisioning
 """
 
+import hashlib
 import os
 import time
 import uuid
@@ -30,6 +31,13 @@ _jwks_cache = {
     "expires_at": 0
 }
 
+# Cache for validated token payloads, keyed by a SHA-256 hash of the raw
+# token (the token itself is never stored). Entries expire after 60s or at
+# the token's own `exp`, whichever comes first.
+TOKEN_CACHE_TTL_SECONDS = 60
+TOKEN_CACHE_MAX_ENTRIES = 10000
+_token_cache = {}
+
 
 class TokenValidationError(Exception):
     """Raised when token validation fails"""
@@ -170,6 +178,32 @@ def validate_azure_ad_token(token: str) -> Dict:
         raise TokenValidationError(f"Unexpected error: {str(e)}")
 
 
+def validate_azure_ad_token_cached(token: str) -> Dict:
+    """
+    validate_azure_ad_token with a short-TTL in-memory cache.
+
+    The same token is presented on every request in a session, so the JWKS
+    lookup + RS256 signature verification (a few ms each) can be skipped on
+    repeat calls. Expiry still respects the token's own `exp` claim.
+    """
+    key = hashlib.sha256(token.encode()).hexdigest()
+    current_time = time.time()
+
+    cached = _token_cache.get(key)
+    if cached and current_time < cached[0]:
+        return cached[1]
+
+    payload = validate_azure_ad_token(token)
+
+    ttl = min(TOKEN_CACHE_TTL_SECONDS, payload.get("exp", 0) - current_time)
+    if ttl > 0:
+        if len(_token_cache) >= TOKEN_CACHE_MAX_ENTRIES:
+            _token_cache.clear()
+        _token_cache[key] = (current_time + ttl, payload)
+
+    return payload
+
+
 def extract_user_info(token_claims: Dict) -> Dict:
     """Extract user info from validated token claims."""
     return {
@@ -190,10 +224,10 @@ def generate_org_id_from_tenant_id(tenant_id: str) -> str:
     return f"org_{clean_tid}"
 
 
-def provision_organization_and_user(db, token_claims: Dict) -> Dict:
+async def provision_organization_and_user(db, token_claims: Dict) -> Dict:
     """
     Auto-provision organization and user on first login.
-    All Cosmos calls are SYNC (not async).
+    All Cosmos calls go through the async client and are awaited.
 
     IMPORTANT: If the org already exists (created via Marketplace Landing Page
     with enterprise tier), we must NOT overwrite the subscription to free/trial.
@@ -205,7 +239,7 @@ def provision_organization_and_user(db, token_claims: Dict) -> Dict:
     azure_ad_object_id = user_info["azure_ad_object_id"]
 
     # Check if org exists for this tenant
-    org = db.get_organization_by_tenant_id(tenant_id)
+    org = await db.get_organization_by_tenant_id(tenant_id)
 
     if not org:
         org_id = generate_org_id_from_tenant_id(tenant_id)
@@ -235,7 +269,7 @@ def provision_organization_and_user(db, token_claims: Dict) -> Dict:
             "created_at": datetime.utcnow().isoformat(),
             "updated_at": datetime.utcnow().isoformat(),
         }
-        db.create_organization(org)
+        await db.create_organization(org)
     else:
         # Org already exists — DO NOT overwrite subscription fields.
         # Just update the org name if it was auto-generated and user now has a
@@ -243,7 +277,7 @@ def provision_organization_and_user(db, token_claims: Dict) -> Dict:
         pass
 
     # Check if user exists
-    user = db.get_user_by_azure_ad_id(azure_ad_object_id)
+    user = await db.get_user_by_azure_ad_id(azure_ad_object_id)
 
     if not user:
         user_id = f"user_{uuid.uuid4().hex[:12]}"
@@ -258,16 +292,16 @@ def provision_organization_and_user(db, token_claims: Dict) -> Dict:
             "role": "user",
             "created_at": datetime.utcnow().isoformat(),
         }
-        db.create_user(user)
+        await db.create_user(user)
 
         # Increment users_count
-        db.increment_org_users_count(org["org_id"])
+        await db.increment_org_users_count(org["org_id"])
     else:
         # Update last login
         user["last_login"] = datetime.utcnow().isoformat()
         user["email"] = user_info["email"]
         user["full_name"] = user_info["full_name"]
-        db.update_user(user)
+        await db.update_user(user)
 
     return {
         "organization": org,
@@ -1,24 +1,52 @@
 import os
+import time
 import uuid
 from datetime import datetime, timedelta
-from typing import Optional, Tuple
+from typing import BinaryIO, List, Optional, Tuple, Union
 from azure.storage.blob import BlobServiceClient, generate_blob_sas, BlobSasPermissions
 
 CONTAINER_NAME = "claims-docs"
 
+# (account_name, account_key) parsed from the connection string, memoized so
+# SAS generation doesn't re-split the string on every call
+_account_credentials = None
+
+# Signed URLs cached per (blob_path, expiry_hours) for an hour less than the
+# SAS lifetime, so repeat claim views reuse the signature instead of redoing
+# the HMAC while staying comfortably inside the validity window
+SAS_CACHE_MARGIN_SECONDS = 60 * 60
+_sas_cache = {}
+
 def get_blob_service_client() -> BlobServiceClient:
     connection_string = os.environ.get("AZURE_STORAGE_CONNECTION_STRING")
     if not connection_string:
         raise ValueError("AZURE_STORAGE_CONNECTION_STRING environment variable is required")
     return BlobServiceClient.from_connection_string(connection_string)
 
+def _get_account_credentials() -> Tuple[Optional[str], Optional[str]]:
+    global _account_credentials
+    if _account_credentials is None:
+        connection_string = os.environ.get("AZURE_STORAGE_CONNECTION_STRING", "")
+        account_name = None
+        account_key = None
+        for part in connection_string.split(";"):
+            if part.startswith("AccountName="):
+                account_name = part.split("=", 1)[1]
+            elif part.startswith("AccountKey="):
+                account_key = part.split("=", 1)[1]
+        _account_credentials = (account_name, account_key)
+    return _account_credentials
+
 async def upload_document(
-    file_content: bytes,
+    file_content: Union[bytes, BinaryIO],
     filename: str,
     content_type: str,
     claim_id: str,
     user_name: str
 ) -> Tuple[str, str]:
+    """Upload a document blob. file_content may be bytes or a file-like
+    object; file-likes are streamed to Blob Storage in chunks rather than
+    buffered in memory."""
     client = get_blob_service_client()
     container_client = client.get_container_client(CONTAINER_NAME)
     
@@ -36,6 +64,7 @@ async def upload_document(
         file_content,
         content_type=content_type,
         overwrite=True,
+        max_concurrency=4,
         metadata={
             "original_filename": filename,
             "claim_id": claim_id,
@@ -49,32 +78,47 @@ async def upload_document(
     return unique_filename, blob_url
 
 def generate_sas_url(blob_path: str, expiry_hours: int = 24) -> str:
-    client = get_blob_service_client()
-    
-    account_name = client.account_name
-    account_key = None
-    
-    connection_string = os.environ.get("AZURE_STORAGE_CONNECTION_STRING", "")
-    for part in connection_string.split(";"):
-        if part.startswith("AccountKey="):
-            account_key = part.split("=", 1)[1]
-            break
-    
-    if not account_key:
-        container_client = client.get_container_client(CONTAINER_NAME)
-        blob_client = container_client.get_blob_client(blob_path)
-        return blob_client.url
-    
-    sas_token = generate_blob_sas(
-        account_name=account_name,
-        container_name=CONTAINER_NAME,
-        blob_name=blob_path,
-        account_key=account_key,
-        permission=BlobSasPermissions(read=True),
-        expiry=datetime.utcnow() + timedelta(hours=expiry_hours)
-    )
-    
-    return f"https://{account_name}.blob.core.windows.net/{CONTAINER_NAME}/{blob_path}?{sas_token}"
+    return generate_sas_urls([blob_path], expiry_hours)[0]
+
+def generate_sas_urls(blob_paths: List[str], expiry_hours: int = 24) -> List[str]:
+    """Generate read SAS URLs for a batch of blobs.
+
+    Credentials and the expiry timestamp are computed once for the whole
+    batch, so per-blob cost is just the HMAC signing.
+    """
+    account_name, account_key = _get_account_credentials()
+
+    if not account_name or not account_key:
+        # No usable key in the connection string - fall back to plain blob URLs
+        container_client = get_blob_service_client().get_container_client(CONTAINER_NAME)
+        return [container_client.get_blob_client(path).url for path in blob_paths]
+
+    now = time.monotonic()
+    cache_ttl = expiry_hours * 3600 - SAS_CACHE_MARGIN_SECONDS
+    expiry = None
+    urls = []
+    for blob_path in blob_paths:
+        cached = _sas_cache.get((blob_path, expiry_hours))
+        if cached and now < cached[0]:
+            urls.append(cached[1])
+            continue
+        if expiry is None:
+            expiry = datetime.utcnow() + timedelta(hours=expiry_hours)
+        sas_token = generate_blob_sas(
+            account_name=account_name,
+            container_name=CONTAINER_NAME,
+            blob_name=blob_path,
+            account_key=account_key,
+            permission=BlobSasPermissions(read=True),
+            expiry=expiry
+        )
+        url = f"https://{account_name}.blob.core.windows.net/{CONTAINER_NAME}/{blob_path}?{sas_token}"
+        if cache_ttl > 0:
+            if len(_sas_cache) >= 10000:
+                _sas_cache.clear()
+            _sas_cache[(blob_path, expiry_hours)] = (now + cache_ttl, url)
+        urls.append(url)
+    return urls
 
 async def delete_document(blob_path: str) -> bool:
     try:
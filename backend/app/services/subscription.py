@@ -128,7 +128,7 @@ def get_trial_days_remaining(org: Dict[str, Any]) -> int:
         return 0
 
 
-def check_claims_limit(org: Dict[str, Any], db) -> Dict[str, Any]:
+async def check_claims_limit(org: Dict[str, Any], db) -> Dict[str, Any]:
     """
     Check if the organization can create more claims this month.
     Returns dict with 'allowed', 'current', 'limit', 'message'.
@@ -148,7 +148,7 @@ def check_claims_limit(org: Dict[str, Any], db) -> Dict[str, Any]:
 
     # Count claims created this month
     org_id = org.get("org_id")
-    claims_this_month = _count_claims_this_month(org_id, db)
+    claims_this_month = await _count_claims_this_month(org_id, db)
 
     allowed = claims_this_month < max_claims
 
@@ -224,7 +224,7 @@ def check_feature_access(org: Dict[str, Any], feature: str) -> bool:
     return limits["features"].get(feature, False)
 
 
-def get_subscription_info(org: Dict[str, Any], db) -> Dict[str, Any]:
+async def get_subscription_info(org: Dict[str, Any], db) -> Dict[str, Any]:
     """
     Get full subscription info for an organization.
     Used by the frontend to display usage, limits, and banners.
@@ -234,7 +234,7 @@ def get_subscription_info(org: Dict[str, Any], db) -> Dict[str, Any]:
     limits = get_tier_limits(tier)
 
     org_id = org.get("org_id")
-    claims_this_month = _count_claims_this_month(org_id, db) if org_id else 0
+    claims_this_month = await _count_claims_this_month(org_id, db) if org_id else 0
 
     info = {
         "subscription_status": status,
@@ -271,15 +271,17 @@ def get_subscription_info(org: Dict[str, Any], db) -> Dict[str, Any]:
 # ============================================================================
 
 
-def _count_claims_this_month(org_id: str, db) -> int:
-    """Count claims created by org in the current calendar month."""
+async def _count_claims_this_month(org_id: str, db) -> int:
+    """Count claims created by org in the current calendar month.
+
+    Uses a server-side COUNT: list_claims only returns one page, and Cosmos
+    may return fewer items per page than requested, so counting a listed
+    page would silently undercount and stop enforcing the free-tier limit.
+    """
     now = datetime.utcnow()
     month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0).isoformat()
 
     try:
-        claims = db.list_claims(org_id, limit=10000)
-        return sum(
-            1 for c in claims if c.get("created_at", "") >= month_start
-        )
+        return await db.count_claims_since(org_id, month_start)
     except Exception:
         return 0